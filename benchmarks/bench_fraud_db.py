@@ -0,0 +1,117 @@
+"""
+Concurrent fraud calls hitting bank_fraud.db: the original connect-per-call
+helpers vs the shared Database (per-thread connections, WAL, cached
+statements). Each simulated call looks its case up twice and writes its
+status once.
+
+    python -m benchmarks.bench_fraud_db
+"""
+import os
+import time
+import random
+import sqlite3
+import tempfile
+import threading
+
+from voice_core.db import Database
+
+CASES = 10_000
+CALLERS = [1, 8, 32]
+CALLS_PER_CALLER = 100
+STATUSES = ["safe", "fraudulent", "failed_verification"]
+
+
+def create(path):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE fraud_cases (
+            username TEXT PRIMARY KEY, security_code TEXT, card_last4 TEXT, merchant TEXT,
+            amount TEXT, location TEXT, timestamp TEXT, case_status TEXT
+        )
+    """)
+    conn.executemany("INSERT INTO fraud_cases VALUES (?,?,?,?,?,?,?,?)",
+                     [(f"user_{i}", "1234", "4242", "Apple Store", "$999.00", "New York, NY", "Today", "pending")
+                      for i in range(CASES)])
+    conn.commit()
+    conn.close()
+
+
+def original_helpers(path):
+    """day6's get_case_by_username / update_case_status before the Database layer"""
+    def get(username):
+        conn = sqlite3.connect(path)
+        c = conn.cursor()
+        c.execute("SELECT * FROM fraud_cases WHERE username=?", (username,))
+        row = c.fetchone()
+        conn.close()
+        return {"username": row[0], "security_code": row[1], "status": row[7]} if row else None
+
+    def update(username, status):
+        conn = sqlite3.connect(path, timeout=30)
+        c = conn.cursor()
+        c.execute("UPDATE fraud_cases SET case_status=? WHERE username=?", (status, username))
+        conn.commit()
+        conn.close()
+    return get, update
+
+
+def pooled_helpers(db):
+    def get(username):
+        return db.query_one("SELECT username, security_code, case_status AS status FROM fraud_cases WHERE username=?",
+                            (username,))
+
+    def update(username, status):
+        db.execute("UPDATE fraud_cases SET case_status=? WHERE username=?", (status, username))
+    return get, update
+
+
+def run(callers, get, update):
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def caller(seed):
+        rng = random.Random(seed)
+        mine = []
+        for _ in range(CALLS_PER_CALLER):
+            username = f"user_{rng.randrange(CASES)}"
+            started = time.perf_counter()
+            try:
+                get(username)
+                get(username)
+                update(username, rng.choice(STATUSES))
+            except sqlite3.Error as e:
+                errors.append(e)
+            mine.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(mine)
+
+    threads = [threading.Thread(target=caller, args=(seed,)) for seed in range(callers)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    seconds = time.perf_counter() - started
+    latencies.sort()
+    return len(latencies) / seconds, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)], len(errors)
+
+
+def report(callers, name, result):
+    rate, p50, p99, errors = result
+    print(f"{callers:>7} {name:<16} {rate:9.0f} {p50 * 1000:7.2f}ms {p99 * 1000:7.2f}ms {errors:>7}")
+
+
+if __name__ == "__main__":
+    print(f"{'callers':>7} {'helpers':<16} {'calls/s':>9} {'p50':>9} {'p99':>9} {'errors':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for callers in CALLERS:
+            path = os.path.join(tmp, f"fraud_{callers}.db")
+            create(path)
+            report(callers, "connect per call", run(callers, *original_helpers(path)))
+
+            path = os.path.join(tmp, f"fraud_{callers}_pooled.db")
+            create(path)
+            db = Database(path)
+            report(callers, "Database", run(callers, *pooled_helpers(db)))
+            db.close()
@@ -0,0 +1,118 @@
+"""
+N SDR sessions saving leads at the same time: the original JSON
+read-modify-write, a SQLite commit per lead, and the group-committing
+LeadStore. Every fifth lead repeats an earlier email.
+
+    python -m benchmarks.bench_lead_store
+"""
+import os
+import json
+import time
+import sqlite3
+import tempfile
+import threading
+from multiprocessing import Process
+
+from voice_core.leads import LeadStore
+
+WRITERS = [1, 8, 32]
+LEADS_PER_WRITER = 25
+PROCESSES = 4
+
+
+def lead(writer, i):
+    unique = writer * LEADS_PER_WRITER + i
+    email = f"lead{unique - unique % 5}@example.com" if i % 5 == 4 else f"lead{unique}@example.com"
+    return {"name": f"Lead {unique}", "company": "Acme", "email": email, "use_case": "payments", "timeline": "Now"}
+
+
+def json_save(path, args):
+    """The original save_lead_to_json"""
+    leads = []
+    if os.path.exists(path):
+        try:
+            with open(path, "r") as f:
+                leads = json.load(f)
+        except:
+            leads = []
+    leads.append(args)
+    with open(path, "w") as f:
+        json.dump(leads, f, indent=4)
+
+
+def sqlite_save(path, args):
+    """A straightforward SQLite version: connect, insert, commit (one fsync) per lead"""
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=FULL")
+    with conn:
+        conn.execute("INSERT INTO leads (email, name, company) VALUES (?, ?, ?) "
+                     "ON CONFLICT(email) DO UPDATE SET name = excluded.name",
+                     (args["email"], args["name"], args["company"]))
+    conn.close()
+
+
+def run_writers(writers, save):
+    def session(w):
+        for i in range(LEADS_PER_WRITER):
+            save(lead(w, i))
+    threads = [threading.Thread(target=session, args=(w,)) for w in range(writers)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - started
+
+
+def process_writer(path, w):
+    store = LeadStore(path)
+    for i in range(LEADS_PER_WRITER):
+        store.save(lead(w, i))
+    store.close()
+
+
+def expected(writers):
+    return len({lead(w, i)["email"] for w in range(writers) for i in range(LEADS_PER_WRITER)})
+
+
+if __name__ == "__main__":
+    print(f"{LEADS_PER_WRITER} leads per writer")
+    print(f"{'writers':>7} {'method':<22} {'leads/s':>9} {'stored':>7} {'expected':>8} {'commits':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for writers in WRITERS:
+            total = writers * LEADS_PER_WRITER
+
+            path = os.path.join(tmp, f"leads_{writers}.json")
+            seconds = run_writers(writers, lambda args: json_save(path, args))
+            with open(path) as f:
+                stored = len(json.load(f))
+            print(f"{writers:>7} {'JSON rewrite':<22} {total / seconds:9.0f} {stored:>7} {total:>8} {'-':>8}")
+
+            path = os.path.join(tmp, f"leads_{writers}_plain.db")
+            conn = sqlite3.connect(path)
+            conn.execute("CREATE TABLE leads (id INTEGER PRIMARY KEY, email TEXT UNIQUE, name TEXT, company TEXT)")
+            conn.close()
+            seconds = run_writers(writers, lambda args: sqlite_save(path, args))
+            conn = sqlite3.connect(path)
+            stored = conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
+            conn.close()
+            print(f"{writers:>7} {'SQLite, commit each':<22} {total / seconds:9.0f} {stored:>7} {expected(writers):>8} {total:>8}")
+
+            store = LeadStore(os.path.join(tmp, f"leads_{writers}.db"))
+            seconds = run_writers(writers, store.save)
+            store.close()
+            print(f"{writers:>7} {'LeadStore, group commit':<22} {total / seconds:9.0f} {len(store):>7} "
+                  f"{expected(writers):>8} {store.commits:>8}")
+
+        path = os.path.join(tmp, "leads_processes.db")
+        LeadStore(path)
+        processes = [Process(target=process_writer, args=(path, w)) for w in range(PROCESSES)]
+        started = time.perf_counter()
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+        seconds = time.perf_counter() - started
+        print(f"{PROCESSES:>7} {'LeadStore, processes':<22} {PROCESSES * LEADS_PER_WRITER / seconds:9.0f} "
+              f"{len(LeadStore(path)):>7} {expected(PROCESSES):>8} {'-':>8}")
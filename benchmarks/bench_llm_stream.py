@@ -0,0 +1,54 @@
+"""
+Reply latency: waiting for the whole LLM reply before speaking vs streaming tokens into sentence TTS.
+
+Uses a simulated token stream (first token after FIRST_TOKEN, then one word every PER_TOKEN)
+and the local Murf stand-in.
+
+    python -m benchmarks.bench_llm_stream
+"""
+import time
+
+from voice_core.audio import NullSink
+from voice_core.murf_standin import MurfStandIn
+from voice_core.tts import MurfClient, Speaker, stream_sentences
+
+REPLY = (
+    "Added 2 Apples and a Sandwich to your cart. "
+    "That brings your total to 14 dollars and 50 cents. "
+    "Would you like me to add some Bread for the sandwiches as well, or shall I place the order now?"
+)
+FIRST_TOKEN = 0.35
+PER_TOKEN = 0.02
+
+
+def fake_token_stream():
+    """What LLM.stream() yields, at a typical gpt-4o-mini pace"""
+    time.sleep(FIRST_TOKEN)
+    for i, word in enumerate(REPLY.split(" ")):
+        if i:
+            time.sleep(PER_TOKEN)
+        yield word if i == 0 else " " + word
+
+
+if __name__ == "__main__":
+    standin = MurfStandIn().start()
+    try:
+        speaker = Speaker("en-US-natalie", client=MurfClient("local", standin.url),
+                          sink=NullSink(realtime=True, bytes_per_second=16))
+
+        started = time.perf_counter()
+        text = "".join(fake_token_stream())
+        utterance = speaker.speak_async(text)
+        utterance.wait()
+        full_first_audio = (utterance.clips[0].started_at - started) if utterance.clips else None
+
+        started = time.perf_counter()
+        utterance = speaker.speak_stream(stream_sentences(fake_token_stream()))
+        utterance.wait()
+        streamed_first_audio = (utterance.clips[0].started_at - started) if utterance.clips else None
+
+        print(f"Full reply, then speak:   first audio after {full_first_audio * 1000:7.1f} ms")
+        print(f"Streamed into sentences:  first audio after {streamed_first_audio * 1000:7.1f} ms")
+        print(f"Chunks spoken: {len(utterance.clips)}")
+    finally:
+        standin.stop()
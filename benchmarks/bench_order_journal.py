@@ -0,0 +1,66 @@
+"""
+Placing one order with HISTORY orders already on file: the original
+read-modify-write of acp_orders.json vs an append to the Journal, plus
+reading the last order back.
+
+    python -m benchmarks.bench_order_journal
+"""
+import os
+import json
+import time
+import tempfile
+
+from voice_core.journal import Journal
+
+HISTORY = [100, 1_000, 10_000]
+ORDERS = 20
+ORDER = {
+    "order_id": "ord_0", "created_at": "2026-01-01T00:00:00", "status": "CONFIRMED", "currency": "INR",
+    "total_amount": 5000,
+    "line_items": [{"product_id": "prod_001", "name": "Developer Hoodie", "quantity": 2, "unit_price": 2500}]
+}
+
+
+def rewrite_order(path, order):
+    """The original create_order persistence"""
+    all_orders = []
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            content = f.read()
+            if content:
+                all_orders = json.loads(content)
+    all_orders.append(order)
+    with open(path, "w") as f:
+        json.dump(all_orders, f, indent=4)
+
+
+def rewrite_last(path):
+    with open(path, "r") as f:
+        return json.load(f)[-1]
+
+
+def timed(fn, runs=ORDERS):
+    started = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - started) / runs
+
+
+if __name__ == "__main__":
+    print(f"{'orders on file':>14} {'rewrite':>10} {'append':>10} {'append+fsync':>13} {'last (json)':>12} {'last (tail)':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for history in HISTORY:
+            legacy = os.path.join(tmp, f"orders_{history}.json")
+            with open(legacy, "w") as f:
+                json.dump([ORDER] * history, f, indent=4)
+            journal = Journal(os.path.join(tmp, f"orders_{history}.jsonl"))
+            journal.import_json(legacy)
+            synced = Journal(os.path.join(tmp, f"orders_{history}.jsonl"), fsync=True)
+
+            rewrite = timed(lambda: rewrite_order(legacy, ORDER))
+            append = timed(lambda: journal.append(ORDER))
+            append_fsync = timed(lambda: synced.append(ORDER))
+            last_json = timed(lambda: rewrite_last(legacy))
+            last_tail = timed(journal.last)
+            print(f"{history:>14} {rewrite * 1000:8.2f}ms {append * 1000:8.3f}ms {append_fsync * 1000:11.3f}ms "
+                  f"{last_json * 1000:10.2f}ms {last_tail * 1000:10.3f}ms")
@@ -0,0 +1,74 @@
+"""
+day9 catalog lookups on a large catalog: the original list scans vs the Catalog indexes.
+
+The catalog is acp_catalog.json blown up to SKUS products with varied names and prices.
+
+    python -m benchmarks.bench_product_search
+"""
+import json
+import time
+import random
+
+from voice_core.catalog import Catalog
+
+SKUS = 100_000
+QUERIES = [
+    {"query": "hoodie"},
+    {"query": "mug", "max_price": 1000},
+    {"category": "electronics", "max_price": 5000},
+    {"max_price": 700},
+    {"query": "wireless keyboard", "category": "electronics"},
+]
+ADJECTIVES = ["Classic", "Premium", "Compact", "Eco", "Pro", "Mini", "Deluxe", "Travel", "Smart", "Vintage"]
+
+
+def linear_search(catalog, query=None, category=None, max_price=None):
+    """The original day9 search_products"""
+    results = catalog
+    if category:
+        results = [p for p in results if p.get("category", "").lower() == category.lower()]
+    if max_price:
+        results = [p for p in results if p.get("price", 0) <= max_price]
+    if query:
+        q = query.lower()
+        results = [p for p in results if q in p.get("name", "").lower() or q in p.get("description", "").lower()]
+    return results
+
+
+def big_catalog(path="acp_catalog.json"):
+    with open(path, "r") as f:
+        base = json.load(f)
+    rng = random.Random(7)
+    catalog = []
+    for i in range(SKUS):
+        product = dict(base[i % len(base)])
+        product["id"] = f"prod_{i:06d}"
+        product["name"] = f"{rng.choice(ADJECTIVES)} {product['name']} {i // len(base)}"
+        product["price"] = max(100, int(product["price"] * rng.uniform(0.5, 1.5)))
+        catalog.append(product)
+    return catalog
+
+
+def timed(fn, runs=20):
+    started = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - started) / runs
+
+
+if __name__ == "__main__":
+    catalog = big_catalog()
+    started = time.perf_counter()
+    index = Catalog(catalog)
+    print(f"Index build for {SKUS} products: {time.perf_counter() - started:.2f} s (once, at load)\n")
+
+    print(f"{'filters':<55} {'scan':>9} {'index':>9}")
+    for filters in QUERIES:
+        scan = timed(lambda: linear_search(catalog, **filters), runs=5)
+        indexed = timed(lambda: index.search(**filters, limit=10))
+        print(f"{json.dumps(filters):<55} {scan * 1000:7.2f}ms {indexed * 1000:7.3f}ms")
+
+    ids = [catalog[i]["id"] for i in range(0, SKUS, SKUS // 100)]
+    scan = timed(lambda: [next((p for p in catalog if p["id"] == product_id), None) for product_id in ids], runs=1)
+    indexed = timed(lambda: [index.get(product_id) for product_id in ids])
+    print(f"{'create_order product lookup (x' + str(len(ids)) + ')':<55} {scan * 1000:7.2f}ms {indexed * 1000:7.3f}ms")
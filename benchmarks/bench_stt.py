@@ -0,0 +1,55 @@
+"""
+Transcription latency per STT backend on the same clip.
+
+    python -m benchmarks.bench_stt                     # scripted stand-in only
+    python -m benchmarks.bench_stt clip.wav google whisper scripted
+"""
+import sys
+import time
+import speech_recognition as sr
+
+from voice_core.stt import GoogleSTT, ScriptedSTT, WhisperSTT
+
+RUNS = 5
+
+
+def load_clip(path):
+    if path is None:
+        # Two seconds of silence at 16 kHz: fine for timing, every backend may return nothing
+        return sr.AudioData(b"\x00\x00" * 32000, 16000, 2)
+    with sr.AudioFile(path) as source:
+        return sr.Recognizer().record(source)
+
+
+def make_backend(kind):
+    if kind == "google":
+        return GoogleSTT()
+    if kind == "whisper":
+        return WhisperSTT()
+    return ScriptedSTT(["hello there"] * RUNS)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    path = args.pop(0) if args and args[0].endswith(".wav") else None
+    audio = load_clip(path)
+
+    for kind in args or ["scripted"]:
+        try:
+            backend = make_backend(kind)
+        except ImportError as e:
+            print(f"{kind:>9}: unavailable ({e})")
+            continue
+        timings = []
+        text = None
+        for _ in range(RUNS):
+            started = time.perf_counter()
+            try:
+                text = backend.transcribe(audio)
+            except sr.UnknownValueError:
+                text = None
+            except Exception as e:
+                print(f"   ❌ STT Error: {e}")
+            timings.append(time.perf_counter() - started)
+        mean = sum(timings) / len(timings)
+        print(f"{kind:>9}: {mean * 1000:8.1f} ms/clip (min {min(timings) * 1000:.1f} ms) -> {text!r}")
@@ -0,0 +1,41 @@
+"""
+Per-utterance Murf overhead: a fresh connection per request vs the pooled keep-alive MurfClient.
+
+    python -m benchmarks.bench_tts_pool
+"""
+import time
+import requests
+
+from voice_core.murf_standin import MurfStandIn
+from voice_core.tts import MurfClient
+
+TURNS = 20
+LINE = "Added 2 Apple(s) to your cart."
+
+
+def fresh_connection_synth(url, text):
+    """What every agent's speak() used to do: two brand-new connections per line"""
+    res = requests.post(url, json={"voiceId": "en-US-natalie", "text": text}, headers={"api-key": "local"})
+    return requests.get(res.json()["audioFile"]).content
+
+
+if __name__ == "__main__":
+    standin = MurfStandIn(base_latency=0.0, per_char=0.0).start()
+    try:
+        started = time.perf_counter()
+        for _ in range(TURNS):
+            fresh_connection_synth(standin.url, LINE)
+        fresh = (time.perf_counter() - started) / TURNS
+
+        client = MurfClient("local", standin.url)
+        started = time.perf_counter()
+        for _ in range(TURNS):
+            client.synthesize(LINE, "en-US-natalie")
+        pooled = (time.perf_counter() - started) / TURNS
+
+        print(f"Fresh connections: {fresh * 1000:6.2f} ms/utterance")
+        print(f"Pooled client:     {pooled * 1000:6.2f} ms/utterance")
+        print(f"Pool stats: {client.stats()}")
+        client.close()
+    finally:
+        standin.stop()
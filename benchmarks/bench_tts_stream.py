@@ -0,0 +1,37 @@
+"""
+Time-to-first-audio: whole-reply synthesis vs sentence streaming, against the local Murf stand-in.
+
+    python -m benchmarks.bench_tts_stream
+"""
+import time
+
+from voice_core.audio import NullSink
+from voice_core.murf_standin import MurfStandIn
+from voice_core.tts import MurfClient, Speaker
+
+REPLY = (
+    "You wake up in a rainy alleyway in Neo-Tokyo. Your head hurts. "
+    "You check your pockets and find a Flashlight and a Datapad. "
+    "A Cyber-cop is walking towards you, his visor glowing red in the rain. "
+    "Somewhere behind you a drone hums. What do you do?"
+)
+
+
+if __name__ == "__main__":
+    # The stand-in's clips are the text itself; ~60 ms of speech per character
+    sink = NullSink(realtime=True, bytes_per_second=16)
+    standin = MurfStandIn().start()
+    try:
+        client = MurfClient("local", standin.url)
+        started = time.perf_counter()
+        audio = client.synthesize(REPLY, "en-US-natalie")
+        blocking_ttfa = time.perf_counter() - started
+        sink.play(audio)
+
+        speaker = Speaker("en-US-natalie", client=client, sink=sink)
+        streaming_ttfa = speaker.speak(REPLY)
+
+        print(f"Blocking  time-to-first-audio: {blocking_ttfa * 1000:7.1f} ms")
+        print(f"Streaming time-to-first-audio: {streaming_ttfa * 1000:7.1f} ms")
+    finally:
+        standin.stop()
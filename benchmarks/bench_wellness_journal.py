@@ -0,0 +1,60 @@
+"""
+Reading a user's last check-in and last week's moods with HISTORY check-ins
+on file: the original wellness_log.json parse vs WellnessJournal.
+
+    python -m benchmarks.bench_wellness_journal
+"""
+import os
+import json
+import time
+import tempfile
+from datetime import datetime, timedelta
+
+from voice_core.wellness import DATE_FORMAT, WellnessJournal
+
+HISTORY = [365, 3_650, 36_500]
+USERS = 10
+
+
+def checkins(count):
+    start = datetime.now() - timedelta(hours=count)
+    return [{"date": (start + timedelta(hours=i)).strftime(DATE_FORMAT), "mood": "Calm", "energy_level": "Medium",
+             "goals": ["Drink water", "Take a walk"], "summary": "A steady day."} for i in range(count)]
+
+
+def json_last(path):
+    """The original load_history"""
+    with open(path, "r") as f:
+        return json.load(f)[-1]
+
+
+def json_week(path):
+    cutoff = (datetime.now() - timedelta(days=7)).strftime(DATE_FORMAT)
+    with open(path, "r") as f:
+        return [entry for entry in json.load(f) if entry["date"] >= cutoff]
+
+
+def timed(fn, runs=20):
+    started = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - started) / runs
+
+
+if __name__ == "__main__":
+    print(f"{'check-ins':>10} {'last (json)':>12} {'last (index)':>13} {'7 days (json)':>14} {'7 days (index)':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for history in HISTORY:
+            entries = checkins(history)
+            legacy = os.path.join(tmp, f"log_{history}.json")
+            with open(legacy, "w") as f:
+                json.dump(entries, f, indent=4)
+            journal = WellnessJournal(os.path.join(tmp, f"journal_{history}.db"))
+            for user in range(USERS):  # every user gets the same history
+                journal.add_many(f"user{user}", entries)
+
+            print(f"{history:>10} {timed(lambda: json_last(legacy)) * 1000:10.2f}ms "
+                  f"{timed(lambda: journal.latest('user3')) * 1000:11.3f}ms "
+                  f"{timed(lambda: json_week(legacy)) * 1000:12.2f}ms "
+                  f"{timed(lambda: journal.recent('user3')) * 1000:13.3f}ms")
+            journal.close()
@@ -2,11 +2,8 @@ import os
 import time
 import json
 import random
-import requests
-import pygame
-import speech_recognition as sr
-from openai import OpenAI
 from dotenv import load_dotenv
+from voice_core import LLM, LiveMicrophone, Speaker, Speculator, normalize_transcript, warm_up
 
 # --- 🔒 SECURITY ---
 load_dotenv()
@@ -19,14 +16,18 @@ if not MURF_API_KEY or not OPENAI_API_KEY:
 
 # --- 🎭 CONFIG ---
 VOICE_ID = "en-US-terrell" 
-MURF_URL = "https://api.murf.ai/v1/speech/generate"
 SCENARIO_FILE = "improv_scenarios.json"
 
-client = OpenAI(api_key=OPENAI_API_KEY)
-pygame.mixer.init()
+llm = LLM(api_key=OPENAI_API_KEY)
+speaker = Speaker(VOICE_ID, api_key=MURF_API_KEY)
+
+INTRO = "Welcome to Improv Battle! I'm your host. I give you a scene, you act it out. Let's go!"
+NO_SPEECH = "I didn't hear anything! Speak up! Let's try the next one."
+OUTRO = "That's the game! Thanks for playing!"
 
 # --- 🎮 GAME STATE ---
 GAME_STATE = {"round": 0, "max_rounds": 3}
+judge = Speculator()  # starts judging when the performer pauses, before the 3 s cut-off
 
 def load_scenarios():
     if not os.path.exists(SCENARIO_FILE):
@@ -41,56 +42,21 @@ SCENARIOS = load_scenarios()
 def speak(text):
     """Host Voice Output"""
     print(f"   🎤 Host: \"{text}\"")
-    headers = {"api-key": MURF_API_KEY, "Content-Type": "application/json"}
-    payload = {"voiceId": VOICE_ID, "text": text, "modelVersion": "GEN2", "format": "MP3"}
+    speaker.speak(text)
 
-    try:
-        res = requests.post(MURF_URL, json=payload, headers=headers)
-        if res.status_code == 200:
-            with open("response.mp3", "wb") as f:
-                f.write(requests.get(res.json()["audioFile"]).content)
-            try:
-                pygame.mixer.music.load("response.mp3")
-                pygame.mixer.music.play()
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
-                pygame.mixer.music.unload()
-            except Exception as e:
-                print(f"   ❌ Audio Error: {e}")
-        else:
-            print(f"   ❌ MURF ERROR: {res.status_code} - {res.text}")
-    except Exception as e:
-        print(f"   ❌ Connection Error: {e}")
+def listen_for_performance(mic):
+    print("\n   🎭 [Action!]")
+    text = mic.listen("   🔴 REC (Start acting! I am listening...)")
+    if not text:
+        print("   (No speech detected)")
+    return text
 
-def listen_to_user():
-    recognizer = sr.Recognizer()
-    
-    # 👇 KEY FIX: Allow 3 seconds of silence before cutting off
-    recognizer.pause_threshold = 3.0 
-    
-    # Lower energy threshold for quiet acting
-    recognizer.energy_threshold = 300
-    recognizer.dynamic_energy_threshold = True
+def round_setup(current_round, scenario):
+    return f"Round {current_round}. You are a {scenario['role']} in a {scenario['setting']}. {scenario['conflict']}... GO!"
 
-    with sr.Microphone() as source:
-        print("\n   🎭 [Action!] (Calibrating mic...)")
-        recognizer.adjust_for_ambient_noise(source, duration=1.0)
-        
-        print("   🔴 REC (Start acting! I am listening...)")
-        
-        try:
-            # phrase_time_limit=30 means you have 30 seconds to act
-            audio = recognizer.listen(source, timeout=None, phrase_time_limit=30)
-            
-            print("   (Processing performance...)")
-            text = recognizer.recognize_google(audio)
-            print(f"   👤 You: \"{text}\"")
-            return text
-        except sr.WaitTimeoutError:
-            print("   (Timeout: No speech detected)")
-            return None
-        except Exception:
-            return None
+# Host lines plus every round announcement the shuffle can deal (each scenario in each round)
+STATIC_LINES = [INTRO, NO_SPEECH, OUTRO] + [round_setup(i + 1, scenario) for i in range(GAME_STATE["max_rounds"])
+                                            for scenario in SCENARIOS]
 
 def get_host_feedback(scenario, user_performance):
     print("   🧠 Host is judging you...")
@@ -99,26 +65,35 @@ def get_host_feedback(scenario, user_performance):
     user_prompt = f"SCENARIO: {scenario['role']} in {scenario['setting']}. {scenario['conflict']}\nPLAYER ACTING: \"{user_performance}\""
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-        )
-        return response.choices[0].message.content
+        return llm.ask(system_prompt, user_prompt)
     except Exception as e:
         print(f"OpenAI Error: {e}")
         return "Score: 5/10. Good effort."
 
+def judge_early(text, stable):
+    """Partial-transcript listener: a stable hypothesis starts the host's feedback right away"""
+    if stable and GAME_STATE["round"] < len(SCENARIOS):
+        scenario = SCENARIOS[GAME_STATE["round"]]
+        judge.start((GAME_STATE["round"], normalize_transcript(text)), get_host_feedback, scenario, text)
+
 # --- 🏁 MAIN GAME LOOP ---
 if __name__ == "__main__":
     print("--- 🎭 IMPROV BATTLE ---")
     
-    intro = "Welcome to Improv Battle! I'm your host. I give you a scene, you act it out. Let's go!"
-    speak(intro)
-    
     random.shuffle(SCENARIOS) 
+
+    # This game's round announcements go first; the rest of STATIC_LINES are cache hits once warmed at build time
+    rounds = min(GAME_STATE["max_rounds"], len(SCENARIOS))
+    setups = [round_setup(i + 1, SCENARIOS[i]) for i in range(rounds)]
+    warm_up(speaker, [INTRO] + setups + STATIC_LINES)
+
+    speak(INTRO)
+
+    # 👇 KEY FIX: Allow 3 seconds of silence before cutting off
+    # phrase_time_limit=30 means you have 30 seconds to act
+    print("   (Calibrating mic...)")
+    mic = LiveMicrophone(calibrate=1.0, pause_threshold=3.0, phrase_time_limit=30, endpoint_silence=1.0).start()
+    mic.add_partial_listener(judge_early)
     
     while GAME_STATE["round"] < GAME_STATE["max_rounds"]:
         if GAME_STATE["round"] >= len(SCENARIOS): break
@@ -128,20 +103,20 @@ if __name__ == "__main__":
         
         print(f"\n--- 🔔 ROUND {current_round} ---")
         
-        setup = f"Round {current_round}. You are a {scenario['role']} in a {scenario['setting']}. {scenario['conflict']}... GO!"
-        speak(setup)
+        speak(round_setup(current_round, scenario))
         
-        user_performance = listen_to_user()
+        user_performance = listen_for_performance(mic)
         
         if not user_performance:
-            speak("I didn't hear anything! Speak up! Let's try the next one.")
+            speak(NO_SPEECH)
             GAME_STATE["round"] += 1
             continue
             
-        feedback = get_host_feedback(scenario, user_performance)
+        key = (GAME_STATE["round"], normalize_transcript(user_performance))
+        feedback = judge.take(key) or get_host_feedback(scenario, user_performance)
         speak(feedback)
         
         GAME_STATE["round"] += 1
         time.sleep(1)
 
-    speak("That's the game! Thanks for playing!")
\ No newline at end of file
+    speak(OUTRO)
\ No newline at end of file
@@ -1,13 +1,6 @@
 import os
-import time
-import json
-import requests
-import pygame
-import speech_recognition as sr
-from datetime import datetime
-from openai import OpenAI
-import os
-from dotenv import load_dotenv  
+from dotenv import load_dotenv
+from voice_core import LLM, Speaker, ToolRegistry, VoiceSession, LiveMicrophone, WellnessJournal, warm_up
 
 # Load the keys from the .env file
 load_dotenv()
@@ -18,58 +11,73 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
 # --- 🧘 CONFIG ---
 # "en-US-natalie" or "en-US-julie" are good, soft voices for wellness
-VOICE_ID = "en-US-natalie" 
-MURF_URL = "https://api.murf.ai/v1/speech/generate"
-LOG_FILE = "wellness_log.json"
+VOICE_ID = "en-US-natalie"
+# Check-ins live in SQLite, indexed per user and date
+JOURNAL_DB = "wellness_journal.db"
+LEGACY_LOG_FILE = "wellness_log.json"
+USER = os.getenv("WELLNESS_USER", "default")
+TREND_DAYS = 7
 
 # Initialize Clients
-client = OpenAI(api_key=OPENAI_API_KEY)
-pygame.mixer.init()
+llm = LLM(api_key=OPENAI_API_KEY)
+speaker = Speaker(VOICE_ID, api_key=MURF_API_KEY)
+
+FIRST_INTRO = "Hello! I am your wellness companion. How are you feeling today?"
+LOGGED_REPLY = "I've logged that for you. Have a wonderful day!"
+FAREWELL = "Take care."
+STATIC_LINES = [FIRST_INTRO, LOGGED_REPLY, FAREWELL]
 
 # --- 🛠 TOOL DEFINITION (Saving Data) ---
-tools = [
-    {
-        "type": "function",
-        "function": {
-            "name": "log_daily_checkin",
-            "description": "Saves the user's mood and goals to the wellness log.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "mood": {"type": "string", "description": "User's current mood (e.g. Energetic, Anxious)"},
-                    "energy_level": {"type": "string", "description": "Low, Medium, or High"},
-                    "goals": {
-                        "type": "array", 
-                        "items": {"type": "string"},
-                        "description": "List of 1-3 simple goals for the day"
-                    },
-                    "summary": {"type": "string", "description": "A brief, supportive summary of the conversation."}
-                },
-                "required": ["mood", "energy_level", "goals", "summary"]
-            }
-        }
-    }
-]
+CHECKIN_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "mood": {"type": "string", "description": "User's current mood (e.g. Energetic, Anxious)"},
+        "energy_level": {"type": "string", "description": "Low, Medium, or High"},
+        "goals": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of 1-3 simple goals for the day"
+        },
+        "summary": {"type": "string", "description": "A brief, supportive summary of the conversation."}
+    },
+    "required": ["mood", "energy_level", "goals", "summary"]
+}
+
+def open_journal():
+    new = not os.path.exists(JOURNAL_DB)
+    journal = WellnessJournal(JOURNAL_DB)
+    if new and os.path.exists(LEGACY_LOG_FILE):
+        try:
+            count = journal.import_json(USER, LEGACY_LOG_FILE)
+            print(f"📂 Imported {count} check-ins from {LEGACY_LOG_FILE} into {JOURNAL_DB}")
+        except Exception as e:
+            print(f"❌ Error importing check-ins: {e}")
+    return journal
+
+JOURNAL = open_journal()
 
 def load_history():
-    """Reads the JSON log to get past context"""
-    if not os.path.exists(LOG_FILE):
-        return None
+    """The user's most recent check-in (an index lookup, not a scan of the whole log)"""
     try:
-        with open(LOG_FILE, "r") as f:
-            data = json.load(f)
-            if data:
-                return data[-1] # Return the most recent entry
-    except:
+        return JOURNAL.latest(USER)
+    except Exception as e:
+        print(f"❌ Error reading journal: {e}")
         return None
-    return None
 
-def generate_system_prompt(last_entry):
+def load_trend():
+    """The user's moods over the last TREND_DAYS days"""
+    try:
+        return JOURNAL.mood_trend(USER, TREND_DAYS)
+    except Exception as e:
+        print(f"❌ Error reading journal: {e}")
+        return []
+
+def generate_system_prompt(last_entry, trend=()):
     """Creates a prompt based on whether we have spoken before"""
     base_prompt = """
     You are a supportive, grounded Health & Wellness Companion.
     Your goal is to check in on the user's mood and help them set 1-3 simple goals.
-    
+
     GUIDELINES:
     1. Be empathetic but NOT a doctor. Do not diagnose.
     2. Keep advice small and actionable (e.g., "Take a 5-min walk", "Drink water").
@@ -77,131 +85,59 @@ def generate_system_prompt(last_entry):
     4. Once you have the Mood, Energy, and Goals, SUMMARIZE them back to the user.
     5. After the user confirms the summary, call the 'log_daily_checkin' function.
     """
-    
+
     if last_entry:
         context = f"""
         CONTEXT FROM LAST SESSION ({last_entry['date']}):
         - User was feeling: {last_entry['mood']}
         - Energy was: {last_entry['energy_level']}
         - Past Goals: {', '.join(last_entry['goals'])}
-        
+
         INSTRUCTION: Start by briefly mentioning their last check-in (e.g., "Last time you were feeling... how is today?")
         """
+        if len(trend) > 1:
+            lines = "\n".join(f"        - {line}" for line in trend)
+            context += f"""
+        MOOD OVER THE LAST {TREND_DAYS} DAYS:
+{lines}
+
+        If there is a clear pattern (e.g. energy dropping all week), gently mention it.
+        """
         return base_prompt + context
     else:
         return base_prompt + "\nINSTRUCTION: This is your first meeting. Introduce yourself warmly."
 
-def listen_to_user():
-    recognizer = sr.Recognizer()
-    with sr.Microphone() as source:
-        print("\n👂 Listening... (Speak now)")
-        recognizer.adjust_for_ambient_noise(source, duration=0.5)
-        try:
-            audio = recognizer.listen(source, timeout=8)
-            text = recognizer.recognize_google(audio)
-            print(f"   👤 You: \"{text}\"")
-            return text
-        except:
-            return None
-
-def speak(text):
-    print(f"   🤖 Companion: \"{text}\"")
-    headers = {"api-key": MURF_API_KEY, "Content-Type": "application/json"}
-    payload = {
-        "voiceId": VOICE_ID,
-        "text": text,
-        "modelVersion": "GEN2", 
-        "format": "MP3"
-    }
-    try:
-        res = requests.post(MURF_URL, json=payload, headers=headers)
-        if res.status_code == 200:
-            with open("response.mp3", "wb") as f:
-                f.write(requests.get(res.json()["audioFile"]).content)
-            try:
-                pygame.mixer.music.load("response.mp3")
-                pygame.mixer.music.play()
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
-                pygame.mixer.music.unload()
-            except Exception as e:
-                print(f"   ❌ Pygame Error: {e}")
-        else:
-            print(f"   ❌ Murf Error: {res.status_code}")
-    except Exception as e:
-        print(f"   ❌ Network Error: {e}")
+registry = ToolRegistry()
 
-def save_entry(args):
-    """Saves the entry to JSON"""
+@registry.tool("Saves the user's mood and goals to the wellness log.", CHECKIN_PARAMETERS, name="log_daily_checkin", final=True)
+def save_entry(**args):
+    """Saves the entry to the journal"""
     print("\n💾 SAVING ENTRY TO JOURNAL...")
-    
-    # Add timestamp
-    entry = args
-    entry["date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    # Read existing data
-    data = []
-    if os.path.exists(LOG_FILE):
-        try:
-            with open(LOG_FILE, "r") as f:
-                data = json.load(f)
-        except:
-            data = []
-            
-    # Append new entry
-    data.append(entry)
-    
-    # Write back
-    with open(LOG_FILE, "w") as f:
-        json.dump(data, f, indent=4)
-        
+
+    # One row insert, timestamped by the journal
+    entry = JOURNAL.add(USER, args)
+
     print(f"✅ Saved: Mood={entry['mood']}, Goals={entry['goals']}")
-    return "I've logged that for you. Have a wonderful day!"
+    return LOGGED_REPLY
 
 # --- 🏁 MAIN LOOP ---
 if __name__ == "__main__":
     print("--- 🧘 Day 3: Wellness Companion ---")
-    
+
     # 1. Load Context
     last_entry = load_history()
-    system_prompt = generate_system_prompt(last_entry)
-    history = [{"role": "system", "content": system_prompt}]
-    
+
     # 2. Dynamic Intro
     if last_entry:
         intro = f"Welcome back! Last time we spoke, you were feeling {last_entry['mood']}. How are you doing today?"
     else:
-        intro = "Hello! I am your wellness companion. How are you feeling today?"
-        
-    speak(intro)
-    history.append({"role": "assistant", "content": intro})
-
-    while True:
-        user_text = listen_to_user()
-        
-        if user_text:
-            if "bye" in user_text.lower():
-                speak("Take care.")
-                break
-
-            history.append({"role": "user", "content": user_text})
-            print("   🧠 Thinking...")
-
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=history,
-                tools=tools,
-                tool_choice="auto" 
-            )
-
-            msg = response.choices[0].message
-
-            if msg.tool_calls:
-                args = json.loads(msg.tool_calls[0].function.arguments)
-                final_response = save_entry(args)
-                speak(final_response)
-                break 
-            else:
-                ai_reply = msg.content
-                history.append({"role": "assistant", "content": ai_reply})
-                speak(ai_reply)
\ No newline at end of file
+        intro = FIRST_INTRO
+    warm_up(speaker, STATIC_LINES)
+    warm_up(speaker, [intro], persist=False)  # may mention the user's mood: keep it off disk
+
+    session = VoiceSession(
+        generate_system_prompt(last_entry, load_trend()), speaker, llm, tools=registry, name="Companion",
+        mic=LiveMicrophone().start(), hint="\n👂 Listening... (Speak now)",
+        farewell=FAREWELL, speculate=True
+    )
+    session.run(intro=intro)
@@ -1,11 +1,7 @@
 import os
-import time
 import json
-import requests
-import pygame
-import speech_recognition as sr
-from openai import OpenAI
-from dotenv import load_dotenv  
+from dotenv import load_dotenv
+from voice_core import LLM, BM25Index, LiveMicrophone, Speaker, VoiceSession, static_prompt, warm_up
 
 # Load the keys from the .env file
 load_dotenv()
@@ -21,162 +17,149 @@ VOICES = {
     "teach_back": "en-US-maverick" # Maverick (The Coach - Distinct Male Voice)
 }
 
-MURF_URL = "https://api.murf.ai/v1/speech/generate"
-
 # Initialize Clients
-client = OpenAI(api_key=OPENAI_API_KEY)
-pygame.mixer.init()
+llm = LLM(api_key=OPENAI_API_KEY)
+speaker = Speaker(VOICES["learn"], api_key=MURF_API_KEY)
+
+INTRO = "Welcome to the Active Recall Coach. Would you like to start with Learn, Quiz, or Teach-Back mode?"
+STATIC_LINES = [(INTRO, VOICES["learn"])]
 
 # --- 📂 LOAD CONTENT ---
+CONTENT_FILE = "day4_tutor_content.json"
+INDEX_FILE = "day4_tutor_content.index.json"  # rebuilt automatically when the content file changes
+ROUTE_MIN_SCORE = 0.5  # how sure the index must be before we switch topic
+ROUTE_MARGIN = 1.5     # ...and by how much the best section must beat the runner-up
+CONTEXT_SECTIONS = 2   # sections sent to the LLM per turn
+
 def load_content():
     try:
-        with open("day4_tutor_content.json", "r") as f:
+        with open(CONTENT_FILE, "r") as f:
             return json.load(f)
     except:
-        print("❌ Error: day4_tutor_content.json not found!")
+        print(f"❌ Error: {CONTENT_FILE} not found!")
         return []
 
 COURSE_CONTENT = load_content()
-CONTENT_TEXT = json.dumps(COURSE_CONTENT) 
-
-# --- 🧠 DYNAMIC PROMPTS ---
-def get_system_prompt(mode, topic):
-    """Returns the instructions based on mode AND current topic"""
-    
-    base_info = f"You are an Active Recall Tutor. The user is currently studying: {topic}. Here is the course content: {CONTENT_TEXT}"
-
-    if mode == "learn":
-        return base_info + """
-        MODE: LEARN (Voice: Ken)
-        GOAL: Explain concepts clearly.
-        INSTRUCTIONS: 
-        1. If the topic is 'General', ask them to choose Variables or Loops.
-        2. If a topic is selected, explain it simply using the 'summary' in the content.
-        3. Ask if they are ready for a quiz.
-        """
-    elif mode == "quiz":
-        return base_info + f"""
-        MODE: QUIZ (Voice: Amara)
-        GOAL: Test the user's knowledge on {topic}.
-        INSTRUCTIONS: 
-        1. Ask a specific question about {topic} based on the content.
-        2. Wait for their answer.
-        3. Tell them if they are right or wrong.
-        """
-    elif mode == "teach_back":
-        return base_info + f"""
-        MODE: TEACH-BACK (Voice: Maverick)
-        GOAL: Rate the user's explanation of {topic}.
-        INSTRUCTIONS: 
-        1. Ask the user to explain {topic} back to you.
-        2. Grade their explanation on a scale of 1-10.
-        3. Give constructive feedback.
-        """
-    else:
-        return base_info + "You are a helpful receptionist. Ask the user to choose a mode: Learn, Quiz, or Teach-Back."
-
-# --- 👂 LISTEN ---
-def listen_to_user():
-    recognizer = sr.Recognizer()
-    with sr.Microphone() as source:
-        print("\n👂 Listening...")
-        recognizer.adjust_for_ambient_noise(source, duration=0.5)
-        try:
-            audio = recognizer.listen(source, timeout=8)
-            text = recognizer.recognize_google(audio)
-            print(f"   👤 You: \"{text}\"")
-            return text
-        except:
-            return None
-
-# --- 🗣 SPEAK ---
-def speak(text, mode):
-    voice_id = VOICES.get(mode, "en-US-ken") 
-    
-    print(f"   🤖 AI ({mode.upper()} - {voice_id}): \"{text}\"")
-    
-    headers = {"api-key": MURF_API_KEY, "Content-Type": "application/json"}
-    payload = {
-        "voiceId": voice_id,
-        "text": text,
-        "modelVersion": "GEN2",
-        "format": "MP3"
+SECTIONS = {section["id"]: section for section in COURSE_CONTENT}
+TOPIC_LIST = ", ".join(section["title"] for section in COURSE_CONTENT)
+
+def build_content_index():
+    """BM25 over the course sections; titles count triple so naming a topic routes to it"""
+    index = BM25Index()
+    for section in COURSE_CONTENT:
+        index.add(section["id"], [(section["title"], 3), (section["id"], 3), (section.get("summary", ""), 1)])
+    return index
+
+CONTENT_INDEX = BM25Index.cached(INDEX_FILE, CONTENT_FILE, build_content_index)
+
+def route_topic(text):
+    """The course section the user is talking about, if the index is confident about it"""
+    hits = CONTENT_INDEX.search(text, limit=2)
+    if not hits or hits[0][1] < ROUTE_MIN_SCORE:
+        return None
+    if len(hits) > 1 and hits[0][1] < ROUTE_MARGIN * hits[1][1]:
+        return None
+    return SECTIONS.get(hits[0][0])
+
+def relevant_sections(text):
+    """This turn's course content: the current topic first, then the best matches for what the user said"""
+    keys = [current_section] if current_section else []
+    keys += [key for key, _ in CONTENT_INDEX.search(text, limit=CONTEXT_SECTIONS)]
+    keys = list(dict.fromkeys(keys))[:CONTEXT_SECTIONS]
+    return [SECTIONS[key] for key in keys if key in SECTIONS]
+
+# --- 🧠 PROMPTS ---
+# Everything that stays the same for the whole session goes first, so the provider can cache it;
+# the current mode and topic are sent last, after the history (see tutor_state)
+TUTOR_PROMPT = static_prompt(
+    f"You are an Active Recall Tutor. Course topics: {TOPIC_LIST}.",
+    """
+    Follow the instructions for the MODE given in CURRENT STATE, about the TOPIC given there.
+    The COURSE CONTENT in CURRENT STATE holds the sections relevant to this turn; base your answers on it.
+
+    MODE: LEARN (Voice: Ken)
+    GOAL: Explain concepts clearly.
+    INSTRUCTIONS: 
+    1. If the topic is 'General', ask them to choose one of the course topics.
+    2. If a topic is selected, explain it simply using the 'summary' in the content.
+    3. Ask if they are ready for a quiz.
+
+    MODE: QUIZ (Voice: Amara)
+    GOAL: Test the user's knowledge on the topic.
+    INSTRUCTIONS: 
+    1. Ask a specific question about the topic based on the content.
+    2. Wait for their answer.
+    3. Tell them if they are right or wrong.
+
+    MODE: TEACH-BACK (Voice: Maverick)
+    GOAL: Rate the user's explanation of the topic.
+    INSTRUCTIONS: 
+    1. Ask the user to explain the topic back to you.
+    2. Grade their explanation on a scale of 1-10.
+    3. Give constructive feedback.
+
+    MODE: GREETING
+    You are a helpful receptionist. Ask the user to choose a mode: Learn, Quiz, or Teach-Back.
+    """
+)
+
+def tutor_state():
+    """Volatile part of the prompt: which mode we're in, what the user is studying and the content for it"""
+    return {
+        "mode": current_mode.replace("_", "-").upper(),
+        "topic": current_topic,
+        "course_content": json.dumps(turn_sections) if turn_sections else None
     }
 
-    try:
-        res = requests.post(MURF_URL, json=payload, headers=headers)
-        if res.status_code == 200:
-            with open("response.mp3", "wb") as f:
-                f.write(requests.get(res.json()["audioFile"]).content)
-            
-            try:
-                pygame.mixer.music.load("response.mp3")
-                pygame.mixer.music.play()
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
-                pygame.mixer.music.unload()
-            except Exception as e:
-                print(f"   ❌ Pygame Error: {e}")
-        else:
-            print(f"   ❌ Murf Error: {res.status_code} - {res.text}")
-    except Exception as e:
-        print(f"   ❌ Network Error: {e}")
+# --- 🔀 TOPIC & MODE SWITCHING ---
+def apply_voice(session, mode):
+    """Points the session at the voice (and label) for a mode"""
+    session.voice_id = VOICES.get(mode, "en-US-ken")
+    session.name = f"AI ({mode.upper()} - {session.voice_id})"
+
+def route_turn(session, user_text):
+    """Detects topic/mode changes before the turn reaches the LLM"""
+    global current_mode, current_topic, current_section, turn_sections
+    user_lower = user_text.lower()
+
+    # --- 🕵 DETECT TOPIC ---
+    section = route_topic(user_text)
+    if section and section["id"] != current_section:
+        current_section = section["id"]
+        current_topic = section["title"]
+        print(f"   📝 Topic Detected: {current_topic}")
+    turn_sections = relevant_sections(user_text)
+
+    new_mode = None
+    if "learn" in user_lower: new_mode = "learn"
+    elif "quiz" in user_lower: new_mode = "quiz"
+    elif "teach" in user_lower or "back" in user_lower: new_mode = "teach_back"
+
+    if new_mode and new_mode != current_mode:
+        print(f"\n🔄 SWITCHING MODE: {current_mode} -> {new_mode} (Topic: {current_topic})\n")
+        current_mode = new_mode
+        apply_voice(session, current_mode)
+
+        # Fresh conversation for the new mode; the system prompt itself never changes
+        session.reset(TUTOR_PROMPT)
+
+        # Add a silent system instruction to force the AI to acknowledge the switch immediately
+        session.history.append({"role": "system", "content": f"User switched to {current_mode} mode. Topic is {current_topic}. Start immediately."})
 
 # --- 🏁 MAIN LOOP ---
 if __name__ == "__main__":
     print("--- 🎓 Active Recall Coach ---")
     print("Modes: [1] Learn (Ken) | [2] Quiz (Amara) | [3] Teach-Back (Maverick)")
-    
+    warm_up(speaker, STATIC_LINES)
+
     current_mode = "greeting"
     current_topic = "General Programming" # <--- NEW: Tracks the topic
-    
+    current_section = None
+    turn_sections = []
+
     # Initialize prompt with topic
-    history = [{"role": "system", "content": get_system_prompt(current_mode, current_topic)}]
-    
-    intro = "Welcome to the Active Recall Coach. Would you like to start with Learn, Quiz, or Teach-Back mode?"
-    speak(intro, "learn")
-    history.append({"role": "assistant", "content": intro})
-
-    while True:
-        user_text = listen_to_user()
-        
-        if user_text:
-            user_lower = user_text.lower()
-
-            # --- 🕵 DETECT TOPIC ---
-            if "loop" in user_lower:
-                current_topic = "Loops"
-                print(f"   📝 Topic Detected: {current_topic}")
-            elif "variable" in user_lower:
-                current_topic = "Variables"
-                print(f"   📝 Topic Detected: {current_topic}")
-
-            # --- 🔀 MODE SWITCHING ---
-            new_mode = None
-            if "learn" in user_lower: new_mode = "learn"
-            elif "quiz" in user_lower: new_mode = "quiz"
-            elif "teach" in user_lower or "back" in user_lower: new_mode = "teach_back"
-            
-            if new_mode and new_mode != current_mode:
-                print(f"\n🔄 SWITCHING MODE: {current_mode} -> {new_mode} (Topic: {current_topic})\n")
-                current_mode = new_mode
-                
-                # Update System Prompt with the CURRENT TOPIC
-                history = [{"role": "system", "content": get_system_prompt(current_mode, current_topic)}]
-                
-                # Add a silent system instruction to force the AI to acknowledge the switch immediately
-                history.append({"role": "system", "content": f"User switched to {current_mode} mode. Topic is {current_topic}. Start immediately."})
-            
-            # --- 🧠 GET AI RESPONSE ---
-            history.append({"role": "user", "content": user_text})
-            
-            print("   🧠 Thinking...")
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=history
-            )
-            
-            ai_reply = response.choices[0].message.content
-            history.append({"role": "assistant", "content": ai_reply})
-            
-            speak(ai_reply,current_mode)
\ No newline at end of file
+    session = VoiceSession(TUTOR_PROMPT, speaker, llm, mic=LiveMicrophone().start(), exit_words=(), speculate=True,
+                           stream_llm=True, state=tutor_state)
+    apply_voice(session, "learn")
+
+    session.run(intro=INTRO, before_turn=route_turn)
@@ -1,12 +1,7 @@
 import os
-import time
-import json
-import requests
-import pygame
-import speech_recognition as sr
 from datetime import datetime
-from openai import OpenAI
-from dotenv import load_dotenv  
+from dotenv import load_dotenv
+from voice_core import LLM, BargeIn, LeadStore, Speaker, ToolRegistry, VoiceSession, LiveMicrophone, warm_up
 
 # Load the keys from the .env file
 load_dotenv()
@@ -17,11 +12,15 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
 # --- 🏢 CONFIG ---
 VOICE_ID = "en-US-natalie" # Professional SDR voice
-MURF_URL = "https://api.murf.ai/v1/speech/generate"
-LEAD_FILE = "razorpay_leads.json"
+# Leads go to SQLite so several SDR sessions can save at once; a repeat email updates the lead
+LEAD_DB = "razorpay_leads.db"
+LEGACY_LEAD_FILE = "razorpay_leads.json"
 
-client = OpenAI(api_key=OPENAI_API_KEY)
-pygame.mixer.init()
+llm = LLM(api_key=OPENAI_API_KEY)
+speaker = Speaker(VOICE_ID, api_key=MURF_API_KEY)
+
+INTRO = "Hi, this is Neha from Razorpay. Thanks for reaching out. What brings you to our website today?"
+STATIC_LINES = [INTRO]
 
 # --- 📚 RAZORPAY KNOWLEDGE BASE ---
 COMPANY_INFO = """
@@ -38,28 +37,19 @@ TARGET AUDIENCE: Startups, SMEs, and Enterprises in India.
 """
 
 # --- 🛠 TOOL: LEAD CAPTURE ---
-tools = [
-    {
-        "type": "function",
-        "function": {
-            "name": "save_lead",
-            "description": "Call this when the conversation ends to save the lead details.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Prospect's name"},
-                    "company": {"type": "string", "description": "Prospect's company name"},
-                    "email": {"type": "string", "description": "Email address"},
-                    "role": {"type": "string", "description": "Job title/Role"},
-                    "use_case": {"type": "string", "description": "Why they need Razorpay (e.g., e-commerce, payroll)"},
-                    "team_size": {"type": "string", "description": "Number of employees"},
-                    "timeline": {"type": "string", "description": "When they want to start (Now, Soon, Later)"}
-                },
-                "required": ["name", "company"] 
-            }
-        }
-    }
-]
+LEAD_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "description": "Prospect's name"},
+        "company": {"type": "string", "description": "Prospect's company name"},
+        "email": {"type": "string", "description": "Email address"},
+        "role": {"type": "string", "description": "Job title/Role"},
+        "use_case": {"type": "string", "description": "Why they need Razorpay (e.g., e-commerce, payroll)"},
+        "team_size": {"type": "string", "description": "Number of employees"},
+        "timeline": {"type": "string", "description": "When they want to start (Now, Soon, Later)"}
+    },
+    "required": ["name", "company"] 
+}
 
 SYSTEM_PROMPT = f"""
 You are "Neha", a Sales Development Rep (SDR) for Razorpay.
@@ -78,111 +68,48 @@ INSTRUCTIONS:
 6. When the user says "That's all" or "Goodbye", call the 'save_lead' tool with whatever info you gathered.
 """
 
-def listen_to_user():
-    recognizer = sr.Recognizer()
-    with sr.Microphone() as source:
-        print("\n👂 Listening... (Ask about Razorpay)")
-        recognizer.adjust_for_ambient_noise(source, duration=0.5)
+registry = ToolRegistry()
+
+def open_leads():
+    new = not os.path.exists(LEAD_DB)
+    store = LeadStore(LEAD_DB)
+    if new and os.path.exists(LEGACY_LEAD_FILE):
         try:
-            audio = recognizer.listen(source, timeout=8)
-            text = recognizer.recognize_google(audio)
-            print(f"   👤 You: \"{text}\"")
-            return text
-        except:
-            return None
-
-def speak(text):
-    print(f"   🤖 Neha (SDR): \"{text}\"")
-    headers = {"api-key": MURF_API_KEY, "Content-Type": "application/json"}
-    payload = {
-        "voiceId": VOICE_ID,
-        "text": text,
-        "modelVersion": "GEN2", 
-        "format": "MP3"
-    }
-    try:
-        res = requests.post(MURF_URL, json=payload, headers=headers)
-        if res.status_code == 200:
-            with open("response.mp3", "wb") as f:
-                f.write(requests.get(res.json()["audioFile"]).content)
-            try:
-                pygame.mixer.music.load("response.mp3")
-                pygame.mixer.music.play()
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
-                pygame.mixer.music.unload()
-            except:
-                pass
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
-
-def save_lead_to_json(args):
-    """Saves the lead to a JSON file"""
+            count = store.import_json(LEGACY_LEAD_FILE)
+            print(f"📂 Imported {count} leads from {LEGACY_LEAD_FILE} into {LEAD_DB}")
+        except Exception as e:
+            print(f"❌ Error importing leads: {e}")
+    return store
+
+LEADS = open_leads()
+
+@registry.tool("Call this when the conversation ends to save the lead details.", LEAD_PARAMETERS, name="save_lead", final=True,
+               conflicts=("leads",), enforce_required=False)  # saved "with whatever info you gathered"
+def save_lead(**args):
+    """Saves the lead to the lead store"""
     print("\n📝 CAPTURING LEAD...")
     
-    # Load existing or create new list
-    leads = []
-    if os.path.exists(LEAD_FILE):
-        try:
-            with open(LEAD_FILE, "r") as f:
-                leads = json.load(f)
-        except:
-            leads = []
-    
     # Add timestamp
     args["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    leads.append(args)
-    
-    with open(LEAD_FILE, "w") as f:
-        json.dump(leads, f, indent=4)
+    outcome = LEADS.save(args)
         
     # Generate a verbal summary string
     summary = f"Thanks {args.get('name', 'there')}. I've noted that you are from {args.get('company', 'your company')} " \
               f"and you are looking at Razorpay for {args.get('use_case', 'payments')}. " \
               f"I have your timeline as {args.get('timeline', 'undecided')}. Our sales team will email you at {args.get('email', 'your email')} shortly."
+    print(f"\n✅ Lead {'Saved' if outcome == 'new' else 'Updated'} in {LEAD_DB}")
     return summary
 
 # --- 🏁 MAIN LOOP ---
 if __name__ == "__main__":
     print("--- 💼 Razorpay SDR Agent ---")
-    
-    history = [{"role": "system", "content": SYSTEM_PROMPT}]
-    
-    intro = "Hi, this is Neha from Razorpay. Thanks for reaching out. What brings you to our website today?"
-    speak(intro)
-    history.append({"role": "assistant", "content": intro})
-
-    while True:
-        user_text = listen_to_user()
-        
-        if user_text:
-            history.append({"role": "user", "content": user_text})
-            print("   🧠 Thinking...")
-
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=history,
-                tools=tools,
-                tool_choice="auto" 
-            )
-
-            msg = response.choices[0].message
-
-            # CASE 1: Tool Call (End of Call / Save Lead)
-            if msg.tool_calls:
-                args = json.loads(msg.tool_calls[0].function.arguments)
-                
-                # Save to JSON
-                summary_text = save_lead_to_json(args)
-                
-                # Speak Summary
-                speak(summary_text)
-                
-                print(f"\n✅ Lead Saved to {LEAD_FILE}")
-                break # End session
-
-            # CASE 2: Normal Conversation
-            else:
-                ai_reply = msg.content
-                history.append({"role": "assistant", "content": ai_reply})
-                speak(ai_reply)
\ No newline at end of file
+    warm_up(speaker, STATIC_LINES)
+
+    mic = LiveMicrophone().start()
+    session = VoiceSession(
+        SYSTEM_PROMPT, speaker, llm, tools=registry, name="Neha (SDR)",
+        mic=mic, hint="\n👂 Listening... (Ask about Razorpay)",
+        exit_words=(), speculate=True,
+        barge_in=BargeIn(mic=mic)  # prospects can cut Neha off mid-pitch
+    )
+    session.run(intro=INTRO)
@@ -1,12 +1,15 @@
 import os
-import time
+import re
 import json
-import sqlite3
-import requests
-import pygame
-import speech_recognition as sr
-from openai import OpenAI
-from dotenv import load_dotenv  
+import sys
+import zlib
+import argparse
+from contextlib import redirect_stdout
+from dotenv import load_dotenv
+from voice_core import (LLM, BatchWriter, Campaign, Database, LiveMicrophone, MurfClient, NullSink, ScriptedSTT,
+                        Speaker, StageTimer, ToolRegistry, VoiceSession, print_report, static_prompt, warm_up)
+from voice_core.llm_standin import LLMStandIn
+from voice_core.murf_standin import MurfStandIn
 
 # Load the keys from the .env file
 load_dotenv()
@@ -17,168 +20,204 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
 # --- 🏦 CONFIG ---
 VOICE_ID = "en-US-terrell" # Serious, professional male voice
-MURF_URL = "https://api.murf.ai/v1/speech/generate"
 DB_FILE = "bank_fraud.db"
+# One reused connection per thread (WAL, cached statements, rows by column name)
+DB = Database(DB_FILE)
 
-client = OpenAI(api_key=OPENAI_API_KEY)
-pygame.mixer.init()
+# --- 📞 CAMPAIGN CONFIG (python day6_fraud_agent.py --campaign) ---
+CAMPAIGN_WORKERS = 8          # simultaneous calls
+CAMPAIGN_BATCH = 50           # status updates per commit
+CAMPAIGN_LOG = "day6_campaign.log"
+STT_LATENCY = 0.3             # stand-in endpointing + transcription per user turn
+
+llm = LLM(api_key=OPENAI_API_KEY)
+speaker = Speaker(VOICE_ID, api_key=MURF_API_KEY)
 
 # --- 🛠 TOOLS (Database Actions) ---
-tools = [
-    {
-        "type": "function",
-        "function": {
-            "name": "verify_and_update_case",
-            "description": "Updates the fraud case status in the bank database.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "username": {"type": "string", "description": "The customer's username"},
-                    "status": {"type": "string", "description": "New status: 'safe', 'fraudulent', or 'failed_verification'"},
-                    "reason": {"type": "string", "description": "Brief note on why this status was chosen"}
-                },
-                "required": ["username", "status", "reason"]
-            }
-        }
-    }
-]
+CASE_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "username": {"type": "string", "description": "The customer's username"},
+        "status": {"type": "string", "description": "New status: 'safe', 'fraudulent', or 'failed_verification'"},
+        "reason": {"type": "string", "description": "Brief note on why this status was chosen"}
+    },
+    "required": ["username", "status", "reason"]
+}
+
+FINAL_REPLY = "Thank you. I have updated your account status. Goodbye."
+FAREWELL = "Goodbye."
+STATIC_LINES = [FINAL_REPLY, FAREWELL]
 
 # --- 🗄 DATABASE HELPERS ---
+CASE_QUERY = """
+    SELECT username, security_code, card_last4, merchant, amount, location, timestamp, case_status AS status
+    FROM fraud_cases WHERE username=?
+"""
+
 def get_case_by_username(username):
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute("SELECT * FROM fraud_cases WHERE username=?", (username,))
-    row = c.fetchone()
-    conn.close()
-    
-    if row:
-        return {
-            "username": row[0],
-            "security_code": row[1],
-            "card_last4": row[2],
-            "merchant": row[3],
-            "amount": row[4],
-            "location": row[5],
-            "timestamp": row[6],
-            "status": row[7]
-        }
-    return None
+    return DB.query_one(CASE_QUERY, (username,))
+
+PENDING_QUERY = """
+    SELECT username, security_code, card_last4, merchant, amount, location, timestamp, case_status AS status
+    FROM fraud_cases WHERE case_status='pending' AND username > ? ORDER BY username LIMIT ?
+"""
+UPDATE_QUERY = "UPDATE fraud_cases SET case_status=? WHERE username=?"
+
+# A campaign sets this so status updates are committed in batches
+STATUS_WRITER = None
+
+def pending_cases(page=500):
+    """Every pending case in username order, one page at a time (an index range scan, never the whole table)"""
+    DB.execute("CREATE INDEX IF NOT EXISTS fraud_cases_status ON fraud_cases (case_status, username)")
+    last = ""
+    while True:
+        cases = DB.query(PENDING_QUERY, (last, page))
+        if not cases:
+            return
+        yield from cases
+        last = cases[-1]["username"]
 
 def update_case_status(username, status):
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute("UPDATE fraud_cases SET case_status=? WHERE username=?", (status, username))
-    conn.commit()
-    conn.close()
+    if STATUS_WRITER:
+        STATUS_WRITER.add((status, username))
+    else:
+        DB.execute(UPDATE_QUERY, (status, username))
     print(f"\n💾 DATABASE UPDATED: User '{username}' marked as '{status.upper()}'")
     return "Case updated successfully."
 
-# --- 🗣 VOICE & LISTEN ---
-def listen_to_user():
-    recognizer = sr.Recognizer()
-    with sr.Microphone() as source:
-        print("\n👂 Listening...")
-        recognizer.adjust_for_ambient_noise(source, duration=0.5)
+registry = ToolRegistry()
+
+@registry.tool("Updates the fraud case status in the bank database.", CASE_PARAMETERS, final=True)
+def verify_and_update_case(username, status, reason=None):
+    """Executes the update, then confirms to the user"""
+    update_case_status(username, status)
+    return FINAL_REPLY
+
+# --- 🧠 PROMPT ---
+# The rules are the same for every call and come first, so they stay a cacheable prefix across calls;
+# the case details are sent as a state message after the history.
+FRAUD_PROMPT = static_prompt("""
+You are a Fraud Prevention Officer at 'Murf Bank'.
+You are calling the customer named in the CURRENT STATE about the transaction described there.
+""", """
+FLOW:
+1. Introduce yourself and say you are calling about suspicious activity.
+2. VERIFICATION: Ask the user for their 4-digit Security Code.
+   - If they get it WRONG (it is NOT the CORRECT SECURITY CODE), end call and mark as 'failed_verification'.
+   - If RIGHT, proceed.
+3. Read the transaction details (Merchant, Amount, Location).
+4. Ask "Did you authorize this transaction?"
+   - If YES: Mark as 'safe'.
+   - If NO: Mark as 'fraudulent' and say you blocked the card.
+5. Call the 'verify_and_update_case' tool to save the result.
+""")
+
+def case_state(case_data):
+    return {
+        "customer": case_data["username"],
+        "card_ending": case_data["card_last4"],
+        "merchant": case_data["merchant"],
+        "amount": case_data["amount"],
+        "location": case_data["location"],
+        "correct_security_code": case_data["security_code"]
+    }
+
+def call_intro(username):
+    return f"Hello, this is the Fraud Department at Murf Bank. Am I speaking with {username}?"
+
+# --- 📞 CAMPAIGN (scripted customers, stand-in STT/TTS/LLM) ---
+def customer_script(case_data):
+    """What the simulated customer says; the outcome is fixed per username so reruns are comparable"""
+    roll = zlib.crc32(case_data["username"].encode()) % 10
+    code = case_data["security_code"] if roll else f"{(int(case_data['security_code']) + 1) % 10000:04d}"
+    answer = "No, I did not make that purchase." if roll < 4 else "Yes, that was me."
+    return ["Yes, speaking.", f"My code is {code}.", answer]
+
+def officer_standin(messages, tools=None):
+    """Plays the officer's side of FRAUD_PROMPT, for campaigns that must not call the real LLM"""
+    state = dict(re.findall(r"^([A-Z ]+): (.*)$", messages[-1]["content"], re.M))
+    user_turns = [m for m in messages if isinstance(m, dict) and m.get("role") == "user"]
+    said = user_turns[-1]["content"].lower() if user_turns else ""
+    username = state.get("CUSTOMER")
+
+    if len(user_turns) <= 1:
+        return "Thank you. To verify your identity, please tell me your 4-digit security code."
+    if len(user_turns) == 2:
+        if state.get("CORRECT SECURITY CODE") not in said:
+            return [("verify_and_update_case", {"username": username, "status": "failed_verification",
+                                                "reason": "Wrong security code"})]
+        return (f"Thank you, you're verified. We saw a charge of {state.get('AMOUNT')} at {state.get('MERCHANT')} "
+                f"in {state.get('LOCATION')} on your card ending {state.get('CARD ENDING')}. "
+                f"Did you authorize this transaction?")
+    status = "safe" if said.startswith("yes") else "fraudulent"
+    return [("verify_and_update_case", {"username": username, "status": status,
+                                        "reason": f"Customer said: {said}"})]
+
+def run_campaign(workers=CAMPAIGN_WORKERS, limit=None):
+    """Calls every pending case with simulated customers; prints calls/minute and per-stage latency"""
+    global STATUS_WRITER
+    console = lambda line: print(line, file=sys.__stdout__, flush=True)
+    timer = StageTimer()
+    writer = STATUS_WRITER = BatchWriter(DB, UPDATE_QUERY, size=CAMPAIGN_BATCH,
+                                         on_flush=lambda rows, seconds: timer.record("db", seconds))
+    standin = MurfStandIn().start()
+    murf = MurfClient("local", standin.url, pool_size=workers)  # no clip cache: every case's lines differ
+    llm_client = LLMStandIn(officer_standin)
+
+    def call(case_data):
+        stt = ScriptedSTT(customer_script(case_data), latency=STT_LATENCY)
+        llm = LLM(client=llm_client, report_prefix=False)
+        llm.chat = timer.wrap("llm", llm.chat)
+        speaker = Speaker(VOICE_ID, client=murf, synth=timer.wrap("tts", murf.synthesize), sink=NullSink())
+        session = VoiceSession(FRAUD_PROMPT, speaker, llm, tools=registry, listen=timer.wrap("stt", stt.listen),
+                               exit_words=(), farewell=FAREWELL, memory=False, state=lambda: case_state(case_data))
         try:
-            audio = recognizer.listen(source, timeout=8)
-            text = recognizer.recognize_google(audio)
-            print(f"   👤 You: \"{text}\"")
-            return text
-        except:
-            return None
-
-def speak(text):
-    print(f"   🤖 Agent: \"{text}\"")
-    headers = {"api-key": MURF_API_KEY, "Content-Type": "application/json"}
-    payload = {"voiceId": VOICE_ID, "text": text, "modelVersion": "GEN2", "format": "MP3"}
+            session.run(intro=call_intro(case_data["username"]), keep_going=lambda: stt.position < len(stt.lines))
+        finally:
+            speaker.sink.close()  # one audio thread per call; don't let thousands pile up
+        outcome = "unresolved"
+        for message in session.history:
+            for tool_call in getattr(message, "tool_calls", None) or []:
+                outcome = json.loads(tool_call.function.arguments).get("status", outcome)
+        return outcome
+
+    console(f"--- 📞 Fraud Campaign: {workers} simultaneous calls (call transcripts in {CAMPAIGN_LOG}) ---")
+    campaign = Campaign(call, workers=workers, timer=timer, progress=console)
     try:
-        res = requests.post(MURF_URL, json=payload, headers=headers)
-        if res.status_code == 200:
-            with open("response.mp3", "wb") as f:
-                f.write(requests.get(res.json()["audioFile"]).content)
-            try:
-                pygame.mixer.music.load("response.mp3")
-                pygame.mixer.music.play()
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
-                pygame.mixer.music.unload()
-            except: pass
-    except: pass
+        with open(CAMPAIGN_LOG, "w") as log, redirect_stdout(log):
+            report = campaign.run(pending_cases(), limit=limit)
+    finally:
+        writer.close()
+        STATUS_WRITER = None
+        standin.stop()
+    print_report(report)
+    print(f"   Status updates: {writer.written} in {writer.batches} commits")
+    return report
 
 # --- 🏁 MAIN LOOP ---
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bank fraud alert agent")
+    parser.add_argument("--campaign", action="store_true", help="Call every pending case with simulated customers")
+    parser.add_argument("--workers", type=int, default=CAMPAIGN_WORKERS, help="Simultaneous campaign calls")
+    parser.add_argument("--limit", type=int, default=None, help="Stop the campaign after this many calls")
+    args = parser.parse_args()
+    if args.campaign:
+        run_campaign(args.workers, args.limit)
+        sys.exit()
+
     print("--- 🏦 Bank Fraud Alert Agent ---")
     
     # 1. Simulate Incoming Call (Ask for Username to load profile)
     username = input("Enter Username to simulate call (e.g. john_doe): ").strip()
     case_data = get_case_by_username(username)
+    warm_up(speaker, STATIC_LINES)
     
     if not case_data:
         print("❌ User not found in database!")
         exit()
 
-    # 2. Build System Prompt with Case Data
-    SYSTEM_PROMPT = f"""
-    You are a Fraud Prevention Officer at 'Murf Bank'.
-    You are calling customer '{case_data['username']}'.
-    
-    CASE DETAILS:
-    - Card Ending: {case_data['card_last4']}
-    - Merchant: {case_data['merchant']}
-    - Amount: {case_data['amount']}
-    - Location: {case_data['location']}
-    - Correct Security Code: {case_data['security_code']}
-    
-    FLOW:
-    1. Introduce yourself and say you are calling about suspicious activity.
-    2. VERIFICATION: Ask the user for their 4-digit Security Code.
-       - If they get it WRONG (it is NOT {case_data['security_code']}), end call and mark as 'failed_verification'.
-       - If RIGHT, proceed.
-    3. Read the transaction details (Merchant, Amount, Location).
-    4. Ask "Did you authorize this transaction?"
-       - If YES: Mark as 'safe'.
-       - If NO: Mark as 'fraudulent' and say you blocked the card.
-    5. Call the 'verify_and_update_case' tool to save the result.
-    """
-
-    history = [{"role": "system", "content": SYSTEM_PROMPT}]
-    
-    # 3. Start Call
-    intro = f"Hello, this is the Fraud Department at Murf Bank. Am I speaking with {username}?"
-    speak(intro)
-    history.append({"role": "assistant", "content": intro})
-
-    while True:
-        user_text = listen_to_user()
-        
-        if user_text:
-            if "bye" in user_text.lower():
-                speak("Goodbye.")
-                break
-
-            history.append({"role": "user", "content": user_text})
-            print("   🧠 Thinking...")
-
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=history,
-                tools=tools,
-                tool_choice="auto" 
-            )
-
-            msg = response.choices[0].message
-
-            if msg.tool_calls:
-                args = json.loads(msg.tool_calls[0].function.arguments)
-                
-                # Execute Update
-                result_msg = update_case_status(args["username"], args["status"])
-                
-                # Confirm to user
-                final_reply = "Thank you. I have updated your account status. Goodbye."
-                speak(final_reply)
-                break 
-            else:
-                ai_reply = msg.content
-                history.append({"role": "assistant", "content": ai_reply})
-                speak(ai_reply)
\ No newline at end of file
+    # 2. Start Call
+    intro = call_intro(username)
+    session = VoiceSession(FRAUD_PROMPT, speaker, llm, tools=registry, mic=LiveMicrophone().start(), farewell=FAREWELL,
+                           speculate=True, state=lambda: case_state(case_data))
+    session.run(intro=intro)
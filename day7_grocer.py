@@ -1,12 +1,8 @@
 import os
-import time
 import json
-import requests
-import pygame
-import speech_recognition as sr
 from datetime import datetime
-from openai import OpenAI
-from dotenv import load_dotenv  
+from dotenv import load_dotenv
+from voice_core import LLM, LiveMicrophone, Speaker, ToolRegistry, VoiceSession, warm_up
 
 # Load the keys from the .env file
 load_dotenv()
@@ -17,12 +13,17 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
 # --- 🛒 CONFIG ---
 VOICE_ID = "en-US-natalie" 
-MURF_URL = "https://api.murf.ai/v1/speech/generate"
+# Speak sentence by sentence while the rest of the reply is still being synthesized
+STREAM_SPEECH = True
 CATALOG_FILE = "grocery_catalog.json"
 ORDER_FILE = "placed_order.json"
 
-client = OpenAI(api_key=OPENAI_API_KEY)
-pygame.mixer.init()
+llm = LLM(api_key=OPENAI_API_KEY)
+speaker = Speaker(VOICE_ID, api_key=MURF_API_KEY, stream=STREAM_SPEECH)
+
+INTRO = "Welcome to the grocery store. What do you need today?"
+ORDER_PLACED = "Order placed! I've saved the receipt to your file."
+STATIC_LINES = [INTRO, ORDER_PLACED, "Your cart is empty!", "Goodbye!"]
 
 # --- 🍎 SETUP CATALOG ---
 DEFAULT_CATALOG = [
@@ -55,6 +56,7 @@ CATALOG = load_catalog()
 
 # --- 🛒 CART FUNCTIONS ---
 CART = {}
+registry = ToolRegistry()
 
 def get_item_details(name):
     for item in CATALOG:
@@ -62,7 +64,8 @@ def get_item_details(name):
             return item
     return None
 
-def add_to_cart(item_name: str, quantity: int):
+@registry.tool("Add item or recipe to cart.", speak=True, conflicts=("cart",))
+def add_to_cart(item_name: str, quantity: int = 1):
     # Smart Recipe Logic
     recipe_hit = None
     for r_key in RECIPES:
@@ -97,6 +100,8 @@ def add_to_cart(item_name: str, quantity: int):
     return f"Added {quantity} {real_name}(s) to your cart."
 
 # 👇 UPDATED: Supports quantity removal 👇
+@registry.tool("Remove item from cart. Specify quantity to remove partial amount.", speak=True, conflicts=("cart",),
+               describe={"quantity": "Optional: amount to remove"})
 def remove_from_cart(item_name: str, quantity: int = None):
     found_key = None
     for key in CART:
@@ -123,6 +128,7 @@ def remove_from_cart(item_name: str, quantity: int = None):
         
     return "That item isn't in your cart."
 
+@registry.tool("Read cart contents", speak=True, conflicts=("cart",))
 def view_cart():
     if not CART:
         return "Your cart is empty."
@@ -135,6 +141,7 @@ def view_cart():
     summary += f"Total: ${total:.2f}"
     return summary
 
+@registry.tool("Finalize and save order", final=True, conflicts=("cart",))
 def place_order():
     if not CART:
         return "Your cart is empty!"
@@ -146,55 +153,10 @@ def place_order():
     with open(ORDER_FILE, "w") as f:
         json.dump(order_data, f, indent=4)
     CART.clear()
-    return "Order placed! I've saved the receipt to your file."
-
-# --- 🧠 OPENAI TOOLS ---
-tools_schema = [
-    {
-        "type": "function",
-        "function": {
-            "name": "add_to_cart",
-            "description": "Add item or recipe to cart.",
-            "parameters": {
-                "type": "object", 
-                "properties": {"item_name": {"type": "string"}, "quantity": {"type": "integer"}}, 
-                "required": ["item_name", "quantity"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "remove_from_cart",
-            "description": "Remove item from cart. Specify quantity to remove partial amount.",
-            "parameters": {
-                "type": "object", 
-                "properties": {
-                    "item_name": {"type": "string"},
-                    "quantity": {"type": "integer", "description": "Optional: amount to remove"} # Added this
-                }, 
-                "required": ["item_name"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "view_cart",
-            "description": "Read cart contents",
-            "parameters": {"type": "object", "properties": {}, "required": []}
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "place_order",
-            "description": "Finalize and save order",
-            "parameters": {"type": "object", "properties": {}, "required": []}
-        }
-    }
-]
+    print(f"\n✅ Order saved to {ORDER_FILE}")
+    return ORDER_PLACED
 
+# --- 🧠 PROMPT ---
 catalog_str = ", ".join([f"{i['name']} (${i['price']})" for i in CATALOG])
 SYSTEM_PROMPT = f"""
 You are a Grocery Assistant.
@@ -206,95 +168,10 @@ INSTRUCTIONS:
 3. If user says "place order", call place_order.
 """
 
-# --- 🗣 AUDIO ---
-def speak(text):
-    print(f"   🤖 Agent: \"{text}\"")
-    headers = {"api-key": MURF_API_KEY, "Content-Type": "application/json"}
-    payload = {"voiceId": VOICE_ID, "text": text, "modelVersion": "GEN2", "format": "MP3"}
-    try:
-        res = requests.post(MURF_URL, json=payload, headers=headers)
-        if res.status_code == 200:
-            with open("response.mp3", "wb") as f:
-                f.write(requests.get(res.json()["audioFile"]).content)
-            try:
-                pygame.mixer.music.load("response.mp3")
-                pygame.mixer.music.play()
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
-                pygame.mixer.music.unload()
-            except: pass
-    except: pass
-
-def listen_to_user():
-    recognizer = sr.Recognizer()
-    with sr.Microphone() as source:
-        print("\n👂 Listening...")
-        recognizer.adjust_for_ambient_noise(source, duration=0.5)
-        try:
-            audio = recognizer.listen(source, timeout=8)
-            text = recognizer.recognize_google(audio)
-            print(f"   👤 You: \"{text}\"")
-            return text
-        except:
-            return None
-
 # --- 🏁 MAIN LOOP ---
 if __name__ == "__main__":
     print("--- 🛒 Grocery Agent (Smarter Version) ---")
-    history = [{"role": "system", "content": SYSTEM_PROMPT}]
-    intro = "Welcome to the grocery store. What do you need today?"
-    speak(intro)
-    history.append({"role": "assistant", "content": intro})
-
-    while True:
-        user_text = listen_to_user()
-        if user_text:
-            if "bye" in user_text.lower():
-                speak("Goodbye!")
-                break
-
-            history.append({"role": "user", "content": user_text})
-            print("   🧠 Thinking...")
-
-            response = client.chat.completions.create(
-                model="gpt-4o-mini", messages=history,
-                tools=tools_schema, tool_choice="auto" 
-            )
-
-            msg = response.choices[0].message
-
-            if msg.tool_calls:
-                history.append(msg)
-                
-                for call in msg.tool_calls:
-                    name = call.function.name
-                    args = json.loads(call.function.arguments)
-                    print(f"   ⚙ Executing {name}...")
-                    
-                    result = "Error"
-                    if name == "add_to_cart":
-                        result = add_to_cart(args["item_name"], args.get("quantity", 1))
-                    elif name == "remove_from_cart":
-                        # Now handles quantity!
-                        result = remove_from_cart(args["item_name"], args.get("quantity"))
-                    elif name == "view_cart":
-                        result = view_cart()
-                    elif name == "place_order":
-                        result = place_order()
-                        speak(result)
-                        print(f"\n✅ Order saved to {ORDER_FILE}")
-                        exit()
-                    
-                    history.append({
-                        "role": "tool",
-                        "tool_call_id": call.id,
-                        "content": str(result)
-                    })
-                
-                final_res = client.chat.completions.create(model="gpt-4o-mini", messages=history)
-                ai_reply = final_res.choices[0].message.content
-                speak(ai_reply)
-                history.append({"role": "assistant", "content": ai_reply})
-            else:
-                speak(msg.content)
-                history.append({"role": "assistant", "content":msg.content})
\ No newline at end of file
+    warm_up(speaker, STATIC_LINES)
+    session = VoiceSession(SYSTEM_PROMPT, speaker, llm, tools=registry, mic=LiveMicrophone().start(), speculate=True,
+                           stream_llm=STREAM_SPEECH)
+    session.run(intro=INTRO)
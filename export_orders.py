@@ -0,0 +1,17 @@
+import sys
+from voice_core import Journal
+
+ORDERS_FILE = "acp_orders.jsonl"
+LEGACY_ORDERS_FILE = "acp_orders.json"
+
+def export_orders(compact=False):
+    """Regenerates the legacy acp_orders.json array from the order journal"""
+    journal = Journal(ORDERS_FILE)
+    if compact:
+        # Drops torn lines left by a crash; only run it while no agent is taking orders
+        journal.compact()
+    journal.export(LEGACY_ORDERS_FILE)
+    print(f"✅ Exported {len(journal)} orders from '{ORDERS_FILE}' to '{LEGACY_ORDERS_FILE}'.")
+
+if __name__ == "__main__":
+    export_orders(compact="--compact" in sys.argv)
@@ -1,6 +1,21 @@
+import sys
+import random
 import sqlite3
 
-def create_database():
+MERCHANTS = [
+    ('Apple Store', 'New York, NY'), ('Unknown Crypto Site', 'Lagos, Nigeria'), ('Amazon', 'Seattle, WA'),
+    ('Luxury Watches Ltd', 'Dubai, UAE'), ('Gas Station', 'Austin, TX'), ('Electronics Hub', 'Shenzhen, China')
+]
+
+def sample_cases(count):
+    """Synthetic pending cases for campaign runs: customer_00001, customer_00002, ..."""
+    rng = random.Random(42)
+    for i in range(1, count + 1):
+        merchant, location = rng.choice(MERCHANTS)
+        yield (f'customer_{i:05d}', f'{rng.randrange(10000):04d}', f'{rng.randrange(10000):04d}', merchant,
+               f'${rng.randrange(20, 5000)}.00', location, 'Today, 2:30 PM', 'pending')
+
+def create_database(extra_cases=0):
     conn = sqlite3.connect('bank_fraud.db')
     c = conn.cursor()
     
@@ -25,10 +40,15 @@ def create_database():
     ]
     
     c.executemany('INSERT OR REPLACE INTO fraud_cases VALUES (?,?,?,?,?,?,?,?)', samples)
+    c.executemany('INSERT OR REPLACE INTO fraud_cases VALUES (?,?,?,?,?,?,?,?)', sample_cases(extra_cases))
+
+    # Campaigns walk the pending cases in username order
+    c.execute('CREATE INDEX IF NOT EXISTS fraud_cases_status ON fraud_cases (case_status, username)')
     
     conn.commit()
     conn.close()
-    print("✅ Database 'bank_fraud.db' created with sample cases.")
+    print(f"✅ Database 'bank_fraud.db' created with {len(samples) + extra_cases} sample cases.")
 
 if __name__ == "__main__":
-    create_database()
\ No newline at end of file
+    # python setup_db.py 5000  -> also adds 5000 synthetic pending cases for day6 campaigns
+    create_database(int(sys.argv[1]) if len(sys.argv) > 1 else 0)
\ No newline at end of file
@@ -0,0 +1,20 @@
+from .audio import NullSink, Playback, PygameSink, make_sink
+from .cache import TTSCache, default_cache
+from .tts import MURF_URL, MurfClient, Speaker, Utterance, split_sentences, stream_sentences
+from .stt import GoogleSTT, ScriptedSTT, WhisperSTT, listen_to_user, make_stt
+from .duplex import BargeIn
+from .mic import LiveMicrophone, SpeechSegment
+from .speculate import Speculator, normalize_transcript
+from .llm import LLM, DEFAULT_MODEL
+from .tools import ToolRegistry
+from .history import HistoryManager
+from .prompt import PrefixTracker, state_message, static_prompt
+from .search import BM25Index, tokenize
+from .catalog import Catalog, ProductIndex
+from .journal import Journal, file_lock
+from .db import BatchWriter, Database
+from .leads import LeadStore
+from .wellness import WellnessJournal
+from .campaign import Campaign, StageTimer, print_report
+from .session import VoiceSession
+from .warmup import warm_up
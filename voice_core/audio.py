@@ -0,0 +1,242 @@
+import io
+import os
+import time
+import queue
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+
+# "memory" (default), "file" (legacy response.mp3 round-trip) or "null" (headless servers)
+AUDIO_SINK = os.getenv("AUDIO_SINK", "memory")
+
+
+class Playback:
+    """Handle for audio that is queued or playing.
+
+    Completes when the audio ends or is stopped. Wait on it, attach
+    callbacks, or `await` it from asyncio code. wait_started() blocks until
+    sound is actually coming out (synthesis can take a while before that).
+    """
+
+    def __init__(self):
+        self._done = threading.Event()
+        self._settled = threading.Event()  # set when sound starts or playback ends, whichever comes first
+        self._callbacks = []
+        self._start_callbacks = []
+        self._lock = threading.Lock()
+        self.stopped = False
+        self.error = None
+        self.started_at = None  # perf_counter() when sound actually started
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Blocks until playback ends; returns False on timeout"""
+        return self._done.wait(timeout)
+
+    def wait_started(self, timeout=None):
+        """Blocks until sound starts; returns False if playback ended without playing (or on timeout)"""
+        self._settled.wait(timeout)
+        return self.started_at is not None
+
+    def add_start_callback(self, fn):
+        """Calls fn(playback) when sound starts (immediately if it already has)"""
+        with self._lock:
+            if self.started_at is None:
+                self._start_callbacks.append(fn)
+                return
+        fn(self)
+
+    def _started(self):
+        with self._lock:
+            if self.started_at is not None:
+                return
+            self.started_at = time.perf_counter()
+            callbacks, self._start_callbacks = self._start_callbacks, []
+        self._settled.set()
+        for fn in callbacks:
+            try:
+                fn(self)
+            except Exception as e:
+                print(f"   ❌ Playback callback error: {e}")
+
+    def add_done_callback(self, fn):
+        """Calls fn(playback) when playback ends (immediately if it already has)"""
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def stop(self):
+        self.stopped = True
+
+    def _finish(self):
+        with self._lock:
+            if self._done.is_set():
+                return
+            self._done.set()
+            self._settled.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            try:
+                fn(self)
+            except Exception as e:
+                print(f"   ❌ Playback callback error: {e}")
+
+    def __await__(self):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(_):
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(self))
+
+        self.add_done_callback(resolve)
+        return future.__await__()
+
+
+class _AudioThreadSink(ABC):
+    """Plays queued clips one after another on a dedicated audio thread"""
+
+    poll_interval = 0.005  # end-of-clip detection granularity (was 100 ms)
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self.current = None
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def play_async(self, audio):
+        """Queues a clip and returns its Playback handle right away"""
+        playback = Playback()
+        self._queue.put((audio, playback))
+        return playback
+
+    def play(self, audio):
+        """Plays a clip and blocks until it ends"""
+        playback = self.play_async(audio)
+        playback.wait()
+        if playback.error:
+            raise playback.error
+
+    def close(self):
+        """Stops the audio thread once the clips already queued have played"""
+        self._queue.put(None)
+
+    def stop_all(self):
+        """Stops the current clip and drops everything queued behind it"""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # keep a pending close()
+                break
+            _, playback = item
+            playback.stop()
+            playback._finish()
+        if self.current:
+            self.current.stop()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            audio, playback = item
+            if playback.stopped:
+                playback._finish()
+                continue
+            self.current = playback
+            try:
+                self._start(audio)
+                playback._started()
+                while self._busy() and not playback.stopped:
+                    time.sleep(self.poll_interval)
+                if playback.stopped:
+                    self._halt()
+                self._release()
+            except Exception as e:
+                playback.error = e
+            self.current = None
+            playback._finish()
+
+    # Subclasses drive the actual device
+    @abstractmethod
+    def _start(self, audio):
+        """Starts playing one clip"""
+
+    @abstractmethod
+    def _busy(self):
+        """True while the current clip is still playing"""
+
+    def _halt(self):
+        pass
+
+    def _release(self):
+        pass
+
+
+class PygameSink(_AudioThreadSink):
+    """Plays MP3 bytes through pygame.
+
+    In memory mode the clip is decoded straight from a BytesIO, so nothing
+    touches the disk and several sessions can share a working directory.
+    """
+
+    def __init__(self, in_memory=True, path="response.mp3"):
+        import pygame  # only needed when we actually play sound
+        self.pygame = pygame
+        self.in_memory = in_memory
+        self.path = path
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        super().__init__()
+
+    def _start(self, audio):
+        music = self.pygame.mixer.music
+        if self.in_memory:
+            music.load(io.BytesIO(audio), "mp3")
+        else:
+            with open(self.path, "wb") as f:
+                f.write(audio)
+            music.load(self.path)
+        music.play()
+
+    def _busy(self):
+        return self.pygame.mixer.music.get_busy()
+
+    def _halt(self):
+        self.pygame.mixer.music.stop()
+
+    def _release(self):
+        # Unload so the buffer (or file) is released before the next clip
+        self.pygame.mixer.music.unload()
+
+
+class NullSink(_AudioThreadSink):
+    """Discards audio. With realtime=True it lasts as long as the clip would have played."""
+
+    def __init__(self, realtime=False, bytes_per_second=16000):
+        self.realtime = realtime
+        self.bytes_per_second = bytes_per_second  # 16000 B/s = 128 kbps MP3
+        self.played = 0
+        self._ends_at = 0.0
+        super().__init__()
+
+    def _start(self, audio):
+        self.played += 1
+        self._ends_at = time.perf_counter() + (len(audio) / self.bytes_per_second if self.realtime else 0.0)
+
+    def _busy(self):
+        return time.perf_counter() < self._ends_at
+
+
+def make_sink(kind=AUDIO_SINK):
+    if kind == "null":
+        return NullSink()
+    if kind == "file":
+        return PygameSink(in_memory=False)
+    return PygameSink()
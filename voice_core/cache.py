@@ -0,0 +1,136 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Where synthesized clips are kept between runs
+CACHE_DIR = os.getenv("TTS_CACHE_DIR", ".tts_cache")
+
+
+def cache_key(voice_id, model_version, audio_format, text):
+    """Content address for one clip"""
+    raw = json.dumps([voice_id, model_version, audio_format, text], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TTSCache:
+    """Two-level clip cache: an in-memory LRU in front of a size-bounded directory of files.
+
+    Only clips put with persist=True reach the directory; the rest live in memory for this process.
+    """
+
+    def __init__(self, directory=CACHE_DIR, memory_bytes=8 * 1024 * 1024, disk_bytes=200 * 1024 * 1024):
+        self.directory = directory
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._memory = OrderedDict()
+        self._memory_used = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._disk_used = self._scan_disk()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.mp3")
+
+    def _scan_disk(self):
+        if not self.directory:
+            return 0
+        return sum(entry.stat().st_size for entry in os.scandir(self.directory) if entry.name.endswith(".mp3"))
+
+    def _remember(self, key, audio):
+        """Puts a clip at the front of the memory LRU, evicting from the back"""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return
+        self._memory[key] = audio
+        self._memory_used += len(audio)
+        while self._memory_used > self.memory_bytes and len(self._memory) > 1:
+            _, old = self._memory.popitem(last=False)
+            self._memory_used -= len(old)
+
+    def get(self, key):
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return audio
+        if self.directory:
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    audio = f.read()
+                os.utime(path)  # mtime doubles as last-used time for disk eviction
+            except OSError:
+                audio = None
+            if audio is not None:
+                with self._lock:
+                    self._remember(key, audio)
+                    self.hits += 1
+                    self.disk_hits += 1
+                return audio
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, audio, persist=True):
+        with self._lock:
+            self._remember(key, audio)
+        if not self.directory or not persist:
+            return
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(audio)
+        os.replace(tmp, path)
+        with self._lock:
+            self._disk_used += len(audio)
+            if self._disk_used > self.disk_bytes:
+                self._evict_disk()
+
+    def _evict_disk(self):
+        """Drops least recently used files until the directory is back under budget"""
+        entries = sorted((e for e in os.scandir(self.directory) if e.name.endswith(".mp3")),
+                         key=lambda e: e.stat().st_mtime)
+        used = sum(e.stat().st_size for e in entries)
+        for entry in entries:
+            if used <= self.disk_bytes:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                used -= size
+            except OSError:
+                pass
+        self._disk_used = used
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "memory_bytes": self._memory_used,
+            "disk_bytes": self._disk_used
+        }
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def default_cache():
+    """Process-wide cache shared by every Speaker that doesn't bring its own"""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = TTSCache()
+        return _default_cache
@@ -0,0 +1,109 @@
+import time
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+
+class StageTimer:
+    """Latency samples per pipeline stage (stt, llm, tts, db...), collected from many concurrent calls"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def record(self, stage, seconds):
+        with self._lock:
+            self.samples[stage].append(seconds)
+
+    @contextmanager
+    def time(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def wrap(self, stage, fn):
+        """`fn`, timed as `stage` on every call"""
+        def timed(*args, **kwargs):
+            with self.time(stage):
+                return fn(*args, **kwargs)
+        return timed
+
+    def summary(self):
+        """{stage: count, mean/p50/p95/max in ms}"""
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self.samples.items()}
+        return {
+            stage: {
+                "count": len(values),
+                "mean_ms": 1000 * sum(values) / len(values),
+                "p50_ms": 1000 * values[len(values) // 2],
+                "p95_ms": 1000 * values[min(len(values) - 1, int(len(values) * 0.95))],
+                "max_ms": 1000 * values[-1]
+            }
+            for stage, values in samples.items() if values
+        }
+
+
+class Campaign:
+    """Runs call(item) -> outcome over a stream of items, `workers` calls at a time.
+
+    Items are pulled from the iterator only as workers free up, so a
+    campaign over a million database rows never holds them all in memory.
+    Each call's duration is timed as the "call" stage.
+    """
+
+    def __init__(self, call, workers=8, timer=None, progress=print, report_every=100):
+        self.call = call
+        self.workers = workers
+        self.timer = timer or StageTimer()
+        self.progress = progress
+        self.report_every = report_every
+        self.outcomes = Counter()
+        self._lock = threading.Lock()
+
+    def _run_one(self, item):
+        started = time.perf_counter()
+        try:
+            outcome = self.call(item)
+        except Exception as e:
+            outcome = "error"
+            self.progress(f"   ❌ Call Error: {e}")
+        self.timer.record("call", time.perf_counter() - started)
+        with self._lock:
+            self.outcomes[outcome] += 1
+            done = sum(self.outcomes.values())
+        if self.progress and self.report_every and done % self.report_every == 0:
+            self.progress(f"   📞 {done} calls done")
+
+    def run(self, items, limit=None):
+        """Works through `items` (up to `limit`); returns the report"""
+        slots = threading.Semaphore(self.workers * 2)  # a few queued calls keep every worker busy
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for count, item in enumerate(items):
+                if limit is not None and count >= limit:
+                    break
+                slots.acquire()
+                future = pool.submit(self._run_one, item)
+                future.add_done_callback(lambda _: slots.release())
+        seconds = time.perf_counter() - started
+        calls = sum(self.outcomes.values())
+        return {
+            "calls": calls,
+            "seconds": seconds,
+            "calls_per_minute": 60 * calls / seconds if seconds else 0.0,
+            "outcomes": dict(self.outcomes),
+            "stages": self.timer.summary()
+        }
+
+
+def print_report(report, progress=print):
+    progress(f"\n📊 {report['calls']} calls in {report['seconds']:.1f}s: {report['calls_per_minute']:.0f} calls/minute")
+    progress("   Outcomes: " + ", ".join(f"{name}={count}" for name, count in sorted(report["outcomes"].items())))
+    progress(f"   {'stage':<8} {'count':>7} {'mean':>9} {'p50':>9} {'p95':>9} {'max':>9}")
+    for stage, s in report["stages"].items():
+        progress(f"   {stage:<8} {s['count']:>7} {s['mean_ms']:7.1f}ms {s['p50_ms']:7.1f}ms "
+                 f"{s['p95_ms']:7.1f}ms {s['max_ms']:7.1f}ms")
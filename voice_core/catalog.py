@@ -0,0 +1,131 @@
+from bisect import bisect_left, bisect_right
+
+from .search import BM25Index, tokenize
+
+
+def search_fields(product):
+    """A product's searchable text, lowercased once: (name, description, category)"""
+    return (product.get("name", "").lower(), product.get("description", "").lower(),
+            product.get("category", "").lower())
+
+
+def product_key(product_id):
+    """Product ids compare without case or surrounding spaces ("PROD_001 " is prod_001)"""
+    return str(product_id).strip().lower()
+
+
+class ProductIndex:
+    """Search index over a product list, built once at load.
+
+    - inverted token index (BM25) over name and description, for ranked keyword search
+    - hash index by lowercase category
+    - products sorted by price, for max_price range queries with bisect
+
+    A query word that is not in the vocabulary also matches the words it is a
+    prefix of, so "hood" still finds "hoodie" like the old substring scan did.
+    A query made only of stopwords ("the") falls back to that scan, and a
+    max_price of 0 means no price limit, as it did there.
+    """
+
+    def __init__(self, products, fields=None):
+        self.products = list(products)
+        # (name, description, category) per product, lowercased; a Catalog passes the ones it already has
+        fields = self.fields = fields or [search_fields(product) for product in self.products]
+        self.text = BM25Index()
+        self.by_category = {}
+        for i, (name, description, category) in enumerate(fields):
+            self.text.add(i, [(name, 3), (description, 1)])
+            self.by_category.setdefault(category, []).append(i)
+        self.price_of = [product.get("price", 0) for product in self.products]
+        self.category_of = [category for _, _, category in fields]
+        self.by_price = sorted(range(len(self.products)), key=self.price_of.__getitem__)
+        self.sorted_prices = [self.price_of[i] for i in self.by_price]
+        self.category_prices = {}
+        for name, bucket in self.by_category.items():
+            bucket.sort(key=self.price_of.__getitem__)
+            self.category_prices[name] = [self.price_of[i] for i in bucket]
+        self.vocabulary = sorted(self.text.postings)
+
+    def _expand(self, term, limit=20):
+        """The term itself if indexed, else the indexed words it is a prefix of"""
+        if term in self.text.postings:
+            return [term]
+        start = bisect_left(self.vocabulary, term)
+        matches = []
+        for word in self.vocabulary[start:start + limit]:
+            if not word.startswith(term):
+                break
+            matches.append(word)
+        return matches
+
+    def search(self, query=None, category=None, max_price=None, limit=10):
+        """Matching products, best first (by relevance with a query, else cheapest first)"""
+        category = category.lower() if category else None
+        bucket = self.by_category.get(category, []) if category else None
+        max_price = max_price or None
+
+        if query and not tokenize(query):
+            # Nothing left to rank on: match the raw query inside name or description, in catalog order
+            q = query.lower()
+            hits = [i for i, (name, description, _) in enumerate(self.fields) if (q in name or q in description)
+                    and (category is None or self.category_of[i] == category)
+                    and (max_price is None or self.price_of[i] <= max_price)]
+            return [self.products[i] for i in hits[:limit]]
+
+        if query:
+            terms = [match for term in tokenize(query) for match in self._expand(term)]
+            scores = self.text.scores(terms)
+            hits = [i for i in scores if (category is None or self.category_of[i] == category)
+                    and (max_price is None or self.price_of[i] <= max_price)]
+            hits.sort(key=lambda i: (-scores[i], self.price_of[i]))
+            return [self.products[i] for i in hits[:limit]]
+
+        if bucket is not None:
+            end = len(bucket) if max_price is None else bisect_right(self.category_prices[category], max_price)
+            return [self.products[i] for i in bucket[:min(end, limit)]]
+
+        if max_price is not None:
+            end = bisect_right(self.sorted_prices, max_price)
+            return [self.products[i] for i in self.by_price[:min(end, limit)]]
+
+        return self.products[:limit]
+
+
+class Catalog:
+    """The product catalog, indexed once at load and shared by every endpoint.
+
+    - get(id): O(1) lookup by product id
+    - in_category(name): the category's products, cheapest first
+    - search(...): ranked search through a ProductIndex
+    - fields: lowercase (name, description, category) per product
+    """
+
+    def __init__(self, products):
+        self.products = list(products)
+        self.fields = [search_fields(product) for product in self.products]
+        self.by_id = {product_key(product["id"]): product for product in self.products if "id" in product}
+        self.index = ProductIndex(self.products, self.fields)
+        self.by_category = {name: [self.products[i] for i in bucket] for name, bucket in self.index.by_category.items()}
+
+    def __len__(self):
+        return len(self.products)
+
+    def __iter__(self):
+        return iter(self.products)
+
+    def __contains__(self, product_id):
+        return product_key(product_id) in self.by_id
+
+    def get(self, product_id):
+        """The product with this id, or None"""
+        return self.by_id.get(product_key(product_id))
+
+    def in_category(self, category):
+        return self.by_category.get(category.lower(), [])
+
+    @property
+    def categories(self):
+        return sorted(self.by_category)
+
+    def search(self, query=None, category=None, max_price=None, limit=10):
+        return self.index.search(query, category, max_price, limit)
@@ -0,0 +1,139 @@
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class Database:
+    """Shared SQLite access for agents that serve many calls at once.
+
+    Every thread gets its own connection, opened on first use and then
+    reused (SQLite connections must not be shared across threads, and
+    reconnecting per query costs more than the query). Connections run in
+    WAL mode, so readers never block on the writer, wait up to `timeout`
+    seconds for the write lock instead of failing, cache prepared
+    statements by SQL text, and return rows as dicts keyed by column name.
+    """
+
+    def __init__(self, path, timeout=30, statements=256):
+        self.path = path
+        self.timeout = timeout
+        self.statements = statements  # prepared statements cached per connection
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def connection(self):
+        """This thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode: writes commit on their own; transaction() groups them
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                   cached_statements=self.statements, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")  # safe in WAL mode; fsyncs at checkpoints
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def query(self, sql, params=()):
+        """All matching rows, as dicts"""
+        return [dict(row) for row in self.connection().execute(sql, params).fetchall()]
+
+    def query_one(self, sql, params=()):
+        """The first matching row as a dict, or None"""
+        row = self.connection().execute(sql, params).fetchone()
+        return dict(row) if row else None
+
+    def stream(self, sql, params=(), batch=500):
+        """Matching rows as dicts, fetched `batch` at a time instead of all at once"""
+        cursor = self.connection().execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(batch)
+            if not rows:
+                return
+            for row in rows:
+                yield dict(row)
+
+    def execute(self, sql, params=()):
+        """Runs one write; returns the number of rows it changed"""
+        return self.connection().execute(sql, params).rowcount
+
+    def execute_many(self, sql, rows):
+        """Runs one write per parameter set in a single transaction; returns the rows changed"""
+        with self.transaction() as conn:
+            return conn.executemany(sql, rows).rowcount
+
+    @contextmanager
+    def transaction(self):
+        """Groups writes into one commit. Takes the write lock up front (BEGIN IMMEDIATE), so two
+        transactions never both read and then deadlock trying to upgrade to writing."""
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self):
+        """Closes every thread's connection"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+class BatchWriter:
+    """Buffers one kind of write and commits it `size` rows at a time, in one transaction.
+
+    Many concurrent calls each updating one row then cost one commit per
+    batch instead of one per call. Rows are also flushed once `interval`
+    seconds have passed since the last commit, and by flush()/close().
+    """
+
+    def __init__(self, db, sql, size=100, interval=1.0, on_flush=None):
+        self.db = db
+        self.sql = sql
+        self.size = size
+        self.interval = interval
+        self.on_flush = on_flush  # on_flush(rows, seconds), e.g. to record commit latency
+        self.rows = []
+        self.batches = 0
+        self.written = 0
+        self._last_flush = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, params):
+        with self._lock:
+            self.rows.append(params)
+            due = len(self.rows) >= self.size or time.perf_counter() - self._last_flush >= self.interval
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Commits the buffered rows now"""
+        with self._lock:
+            rows, self.rows = self.rows, []
+            self._last_flush = time.perf_counter()
+        if not rows:
+            return
+        started = time.perf_counter()
+        try:
+            self.db.execute_many(self.sql, rows)
+        except Exception:
+            with self._lock:
+                self.rows[:0] = rows  # keep them for the next flush
+            raise
+        with self._lock:
+            self.batches += 1
+            self.written += len(rows)
+        if self.on_flush:
+            self.on_flush(rows, time.perf_counter() - started)
+
+    def close(self):
+        self.flush()
@@ -0,0 +1,130 @@
+import math
+import time
+import queue
+import array
+from contextlib import contextmanager
+from collections import deque
+
+import speech_recognition as sr
+
+from .stt import hears_audio, make_stt
+
+
+def rms(frame):
+    """Loudness of one chunk of 16-bit PCM"""
+    samples = array.array("h", frame)
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+
+class BargeIn:
+    """Keeps the microphone open while the agent talks and cuts the agent off when the user starts speaking.
+
+    The noise floor is measured during the first moments of audible playback
+    (after synthesis, once the first clip has started), so it includes the
+    agent's own voice leaking into the mic; the user has to be `sensitivity`
+    times louder than that to count as an interruption.
+    """
+
+    def __init__(self, sensitivity=2.5, min_threshold=300, onset_ms=150, pause_ms=800, max_seconds=15,
+                 calibrate=0.3, device_index=None, transcribe=None, mic=None):
+        self.sensitivity = sensitivity
+        self.min_threshold = min_threshold
+        self.onset_ms = onset_ms
+        self.pause_ms = pause_ms
+        self.max_seconds = max_seconds
+        self.calibrate = calibrate
+        self.device_index = device_index
+        self.mic = mic  # share a LiveMicrophone's stream instead of opening a second one
+        self.transcribe = transcribe or make_stt().transcribe
+        # Seconds from speech onset until the agent's audio actually stopped, one per barge-in
+        self.latencies = []
+
+    @contextmanager
+    def _frames(self):
+        """Yields (read, sample_rate, sample_width, chunk_seconds) for whichever microphone we use"""
+        if self.mic:
+            frames = queue.Queue()
+            tap = lambda frame, energy: frames.put(frame)
+            self.mic.add_tap(tap)
+            try:
+                yield frames.get, self.mic.sample_rate, self.mic.sample_width, self.mic.chunk_seconds
+            finally:
+                self.mic.remove_tap(tap)
+            return
+        with sr.Microphone(device_index=self.device_index) as source:
+            yield (lambda: source.stream.read(source.CHUNK)), source.SAMPLE_RATE, source.SAMPLE_WIDTH, \
+                source.CHUNK / source.SAMPLE_RATE
+
+    def watch(self, playback):
+        """Listens while `playback` plays. Returns what the user said if they interrupted, else None."""
+        if not hears_audio(self.transcribe):
+            return None  # a scripted backend's next line belongs to the next listen(), not to an interruption
+        # Calibrating while Murf (or the LLM) is still working would measure room silence, not the agent's voice
+        if not playback.wait_started():
+            return None
+        with self._frames() as (read, sample_rate, sample_width, chunk_seconds):
+            # Echo-aware noise floor
+            floor = []
+            while not playback.done and len(floor) * chunk_seconds < self.calibrate:
+                floor.append(rms(read()))
+            if playback.done:
+                return None
+            threshold = max(self.min_threshold, self.sensitivity * sum(floor) / len(floor))
+
+            onset_chunks = max(1, math.ceil(self.onset_ms / 1000 / chunk_seconds))
+            preroll = deque(maxlen=onset_chunks + 3)
+            loud = 0
+            onset = None
+            while not playback.done:
+                frame = read()
+                preroll.append(frame)
+                if rms(frame) > threshold:
+                    loud += 1
+                    if loud == 1:
+                        onset = time.perf_counter() - chunk_seconds
+                    if loud >= onset_chunks:
+                        break
+                else:
+                    loud = 0
+            else:
+                return None
+
+            # ✋ The user is talking: stop the agent right away
+            playback.stop()
+            for clip in getattr(playback, "clips", []):
+                clip.wait(0.5)
+            latency = time.perf_counter() - onset
+            self.latencies.append(latency)
+            print(f"   ✋ Barge-in ({latency * 1000:.0f} ms)")
+
+            # Keep recording until the user pauses; the agent is quiet now so the plain floor applies
+            quiet_threshold = max(self.min_threshold, threshold / self.sensitivity)
+            frames = list(preroll)
+            quiet = 0
+            while quiet * chunk_seconds < self.pause_ms / 1000 and len(frames) * chunk_seconds < self.max_seconds:
+                frame = read()
+                frames.append(frame)
+                quiet = quiet + 1 if rms(frame) < quiet_threshold else 0
+
+            audio = sr.AudioData(b"".join(frames), sample_rate, sample_width)
+
+        try:
+            text = self.transcribe(audio)
+        except sr.UnknownValueError:
+            return None
+        except Exception as e:
+            print(f"   ❌ STT Error: {e}")
+            return None
+        print(f"   👤 You (interrupting): \"{text}\"")
+        return text
+
+    def stats(self):
+        if not self.latencies:
+            return {"interrupts": 0, "mean_ms": None, "max_ms": None}
+        return {
+            "interrupts": len(self.latencies),
+            "mean_ms": 1000 * sum(self.latencies) / len(self.latencies),
+            "max_ms": 1000 * max(self.latencies)
+        }
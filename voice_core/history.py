@@ -0,0 +1,128 @@
+import threading
+
+SUMMARY_PROMPT = (
+    "You keep a running summary of a voice conversation between a user and an assistant. "
+    "Merge the new turns into the current summary. Keep everything the assistant may need later: "
+    "names, choices, items and quantities, numbers, decisions and open questions. "
+    "Reply with the updated summary only, in under 150 words."
+)
+SUMMARY_PREFIX = "Summary of the conversation so far: "
+
+
+def _encoder():
+    try:
+        import tiktoken  # optional: exact counts for OpenAI models
+        return tiktoken.get_encoding("o200k_base").encode
+    except Exception:
+        return None
+
+
+_encode = _encoder()
+
+
+def count_tokens(text):
+    if not text:
+        return 0
+    if _encode:
+        return len(_encode(text))
+    return len(text) // 4 + 1  # ~4 characters per token for English
+
+
+def _field(message, key):
+    return message.get(key) if isinstance(message, dict) else getattr(message, key, None)
+
+
+def message_text(message):
+    """The text a message contributes to the prompt, tool calls included"""
+    parts = [_field(message, "content") or ""]
+    for call in _field(message, "tool_calls") or []:
+        function = call["function"] if isinstance(call, dict) else call.function
+        name = function["name"] if isinstance(function, dict) else function.name
+        arguments = function["arguments"] if isinstance(function, dict) else function.arguments
+        parts.append(f"{name}({arguments})")
+    return " ".join(p for p in parts if p)
+
+
+def message_tokens(message):
+    return count_tokens(message_text(message)) + 4  # role and framing overhead per message
+
+
+class HistoryManager:
+    """Keeps a session's history under a token budget.
+
+    The system prompt and the last `keep_turns` user turns stay verbatim.
+    When the history goes over `budget` tokens, the turns before those are
+    folded into a running summary by a background LLM call; the summary
+    replaces them at the next apply(), between turns. Turns are cut at user
+    messages, so a tool call is never separated from its results. Summaries
+    go through a fork of the session's LLM, so they don't show up in its
+    call count or prompt-prefix stats.
+    """
+
+    def __init__(self, llm, budget=4000, keep_turns=6, summarize=None):
+        self.llm = llm.fork()
+        self.budget = budget
+        self.keep_turns = keep_turns
+        self.summarize = summarize or self._summarize
+        self.summary = ""
+        self.summary_message = None
+        self.last_tokens = 0
+        self.summaries = 0
+        self._pending = None  # (folded messages, new summary) waiting to be applied
+        self._job = None
+
+    def tokens(self, history):
+        self.last_tokens = sum(message_tokens(m) for m in history)
+        return self.last_tokens
+
+    def _start(self, history):
+        """Index of the first conversational message (after the system prompt and summary)"""
+        start = 1
+        if len(history) > 1 and history[1] is self.summary_message:
+            start = 2
+        return start
+
+    def maintain(self, history):
+        """Call after a turn: starts summarizing old turns in the background if the history is over budget"""
+        if self._job and self._job.is_alive():
+            return
+        if self.tokens(history) <= self.budget:
+            return
+        start = self._start(history)
+        user_turns = [i for i in range(start, len(history)) if _field(history[i], "role") == "user"]
+        if len(user_turns) <= self.keep_turns:
+            return
+        folded = history[start:user_turns[-self.keep_turns]]
+        summary = self.summary if start == 2 else ""
+        self._job = threading.Thread(target=self._fold, args=(summary, folded), daemon=True)
+        self._job.start()
+
+    def _fold(self, summary, folded):
+        try:
+            self._pending = (folded, self.summarize(summary, folded))
+        except Exception as e:
+            print(f"   ❌ Summary Error: {e}")
+
+    def apply(self, history):
+        """Call between turns: swaps the summarized turns for the updated summary, in place"""
+        pending, self._pending = self._pending, None
+        if not pending:
+            return
+        folded, summary = pending
+        start = self._start(history)
+        current = history[start:start + len(folded)]
+        if len(current) != len(folded) or any(a is not b for a, b in zip(current, folded)):
+            return  # the history was reset or rewritten meanwhile; this summary no longer fits
+        self.summary = summary
+        self.summary_message = {"role": "system", "content": SUMMARY_PREFIX + summary}
+        history[1:start + len(folded)] = [self.summary_message]
+        self.summaries += 1
+        print(f"   🗜 History compacted: {len(folded)} messages -> summary ({self.tokens(history)} tokens now)")
+
+    def _summarize(self, summary, folded):
+        transcript = "\n".join(f"{_field(m, 'role')}: {message_text(m)}" for m in folded)
+        return self.llm.ask(SUMMARY_PROMPT, f"CURRENT SUMMARY:\n{summary or '(none)'}\n\nNEW TURNS:\n{transcript}")
+
+    def stats(self):
+        return {"tokens": self.last_tokens, "budget": self.budget, "summaries": self.summaries,
+                "summary_calls": self.llm.calls}
@@ -0,0 +1,165 @@
+import os
+import json
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl  # POSIX advisory locks; on Windows appends rely on O_APPEND alone
+except ImportError:
+    fcntl = None
+
+
+@contextmanager
+def file_lock(f):
+    """Holds an advisory lock on an open file across processes (no-op where fcntl is missing)"""
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class Journal:
+    """Append-only JSON Lines log of records (orders, leads...).
+
+    append() writes one line at the end of the file, so it costs the same
+    with ten records or a million; with fsync=True it also waits until the
+    line is on disk. An in-memory offset index (byte position of each
+    record) is built on first use and then only extended, so get(n) is a
+    single seek, and last() reads just the tail of the file. Several
+    processes can append to the same journal: writes are serialized with a
+    file lock and each process picks up the others' lines on its next read.
+    An agent's old JSON array file is carried over by import_json() on first use.
+    """
+
+    def __init__(self, path, fsync=False):
+        self.path = path
+        self.fsync = fsync
+        self.offsets = []  # record number -> byte offset of its line
+        self._end = 0      # bytes of the file covered by `offsets`
+        self._lock = threading.Lock()
+
+    def append(self, record):
+        """Adds one record at the end of the journal"""
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock, open(self.path, "a+b") as f, file_lock(f):
+            offset = f.seek(0, os.SEEK_END)
+            if offset:
+                f.seek(offset - 1)
+                if f.read(1) != b"\n":
+                    # A writer died mid-line; start on a fresh line so this record stays readable
+                    line = b"\n" + line
+                    offset += 1
+            f.write(line)  # "a" mode: always lands at the end of the file
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            if self._end == offset:
+                # The index is current; extend it. Otherwise the next read catches up.
+                self.offsets.append(offset)
+                self._end = offset + len(line)
+
+    def _refresh(self):
+        """Extends the offset index over lines appended since the last look (by us or another process)"""
+        if not os.path.exists(self.path):
+            self.offsets, self._end = [], 0
+            return
+        size = os.path.getsize(self.path)
+        if size < self._end:
+            self.offsets, self._end = [], 0  # the file was replaced (compacted or reset); re-index it
+        if size == self._end:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self._end)
+            position = self._end
+            for line in f:
+                if position + len(line) > size or not line.endswith(b"\n"):
+                    break  # a line still being written
+                if self._parse(line) is not None:
+                    self.offsets.append(position)
+                position += len(line)
+        self._end = position
+
+    @staticmethod
+    def _parse(line):
+        """The record on a line, or None for blank and torn (crashed writer) lines"""
+        if not line.strip():
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+
+    def __len__(self):
+        with self._lock:
+            self._refresh()
+            return len(self.offsets)
+
+    def get(self, n):
+        """Record number `n` (negative counts from the end)"""
+        with self._lock:
+            self._refresh()
+            offset = self.offsets[n]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def last(self):
+        """The newest record, or None; reads only the end of the file"""
+        try:
+            with open(self.path, "rb") as f:
+                position = f.seek(0, os.SEEK_END)
+                tail = b""
+                while position > 0:
+                    step = min(4096, position)
+                    position -= step
+                    f.seek(position)
+                    lines = (f.read(step) + tail).split(b"\n")
+                    # The first piece may be the end of an earlier line, unless this is the start of the file
+                    tail = lines.pop(0) if position else b""
+                    for line in reversed(lines):
+                        record = self._parse(line)
+                        if record is not None:
+                            return record
+        except OSError:
+            pass
+        return None
+
+    def __iter__(self):
+        """Every record, oldest first"""
+        try:
+            with open(self.path, "rb") as f:
+                for line in f:
+                    record = self._parse(line)
+                    if record is not None:
+                        yield record
+        except FileNotFoundError:
+            return
+
+    def export(self, path, indent=4):
+        """Writes every record as one JSON array (the legacy file format), atomically"""
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(list(self), f, indent=indent)
+        os.replace(tmp, path)
+
+    def compact(self):
+        """Rewrites the journal without torn or blank lines. Run it while no other process is appending."""
+        tmp = f"{self.path}.tmp"
+        with self._lock, open(self.path, "ab") as lock, file_lock(lock):
+            with open(tmp, "w", encoding="utf-8") as f:
+                for record in self:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            os.replace(tmp, self.path)
+            self.offsets, self._end = [], 0
+
+    def import_json(self, path):
+        """Appends the records of a legacy JSON array file; returns how many"""
+        with open(path, "r") as f:
+            records = json.load(f)
+        for record in records:
+            self.append(record)
+        return len(records)
@@ -0,0 +1,77 @@
+from openai import OpenAI
+
+from .prompt import PrefixTracker
+
+DEFAULT_MODEL = "gpt-4o-mini"
+
+
+class LLM:
+    """Thin wrapper around the OpenAI chat client shared by every agent"""
+
+    def __init__(self, api_key=None, model=DEFAULT_MODEL, client=None, report_prefix=True):
+        self.api_key = api_key
+        self._client = client
+        self.model = model
+        self.calls = 0
+        self.prefix = PrefixTracker()
+        self.report_prefix = report_prefix
+
+    def fork(self, report_prefix=False):
+        """Another LLM on the same client and model, with its own call count and prefix stats"""
+        return LLM(api_key=self.api_key, model=self.model, client=self._client, report_prefix=report_prefix)
+
+    @property
+    def client(self):
+        """The OpenAI client, created on first use so code paths that never call it need no API key"""
+        if self._client is None:
+            self._client = OpenAI(api_key=self.api_key)
+        return self._client
+
+    def _observe(self, messages, tools=None):
+        prefix, total = self.prefix.observe(messages, tools)
+        if self.report_prefix:
+            print(f"   📦 Prompt: {total} tokens, {prefix} cacheable prefix")
+
+    def chat(self, messages, tools=None, tool_choice="auto"):
+        """One chat completion; returns the assistant message.
+
+        Follow-ups that must not call tools still pass them, with tool_choice="none": the tools are
+        part of the prompt prefix, so dropping them would miss the provider's prompt cache.
+        """
+        kwargs = {"model": self.model, "messages": messages}
+        if tools:
+            kwargs["tools"] = tools
+            kwargs["tool_choice"] = tool_choice
+        self.calls += 1
+        self._observe(messages, tools)
+        response = self.client.chat.completions.create(**kwargs)
+        return response.choices[0].message
+
+    def stream(self, messages, tools=None):
+        """Chat completion with stream=True; returns an iterator over the reply text as it arrives.
+
+        `tools` are sent (for the cached prefix) but never called.
+        """
+        kwargs = {"model": self.model, "messages": messages, "stream": True}
+        if tools:
+            kwargs["tools"] = tools
+            kwargs["tool_choice"] = "none"
+        self.calls += 1
+        self._observe(messages, tools)
+        response = self.client.chat.completions.create(**kwargs)
+        return (chunk.choices[0].delta.content for chunk in response
+                if chunk.choices and chunk.choices[0].delta.content)
+
+    def ask(self, system_prompt, user_prompt):
+        """Single-shot question with no history; returns the reply text"""
+        return self.chat([
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]).content
+
+    def ask_stream(self, system_prompt, user_prompt):
+        """Streaming ask(); yields the reply text as it arrives"""
+        return self.stream([
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ])
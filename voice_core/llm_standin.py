@@ -0,0 +1,50 @@
+"""
+Local stand-in for the OpenAI chat client, for load tests and campaigns without API calls.
+
+    llm = LLM(client=LLMStandIn(respond))
+
+respond(messages, tools) returns the reply text, or a list of (tool name, arguments) tool calls.
+"""
+import json
+import time
+import uuid
+import threading
+from types import SimpleNamespace
+
+
+class LLMStandIn:
+    """Fake chat.completions: replies come from `respond`, after a delay that grows with the reply length"""
+
+    def __init__(self, respond, first_token=0.35, per_token=0.02):
+        self.respond = respond
+        self.first_token = first_token
+        self.per_token = per_token
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model=None, messages=(), tools=None, tool_choice=None, stream=False, **kwargs):
+        with self._lock:
+            self.requests += 1
+        reply = self.respond(messages, tools if tool_choice != "none" else None)  # "none": text only
+        if isinstance(reply, str):
+            message = SimpleNamespace(role="assistant", content=reply, tool_calls=None)
+            tokens = len(reply.split())
+        else:
+            calls = [SimpleNamespace(id=f"call_{uuid.uuid4().hex[:12]}", type="function",
+                                     function=SimpleNamespace(name=name, arguments=json.dumps(arguments)))
+                     for name, arguments in reply]
+            message = SimpleNamespace(role="assistant", content=None, tool_calls=calls)
+            tokens = sum(len(call.function.arguments) // 4 for call in calls)
+        if stream:
+            return self._stream(message.content or "")
+        time.sleep(self.first_token + self.per_token * tokens)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    def _stream(self, text):
+        time.sleep(self.first_token)
+        for i, word in enumerate(text.split(" ")):
+            if i:
+                time.sleep(self.per_token)
+            delta = SimpleNamespace(content=word if i == 0 else " " + word)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
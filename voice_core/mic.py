@@ -0,0 +1,245 @@
+import time
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import speech_recognition as sr
+
+from .duplex import rms
+from .stt import hears_audio, make_stt
+
+
+class SpeechSegment:
+    """One stretch of speech cut out of the live stream"""
+
+    def __init__(self, audio, started_at, ended_at, hypothesis=None):
+        self.audio = audio
+        self.started_at = started_at
+        self.ended_at = ended_at
+        # Future for the endpoint partial when no speech followed it: the final transcript, already in flight
+        self.hypothesis = hypothesis
+
+
+class LiveMicrophone:
+    """A microphone that stays open for the whole session.
+
+    It calibrates once at start(), then a capture thread keeps adapting the
+    energy threshold during silence (same damping as speech_recognition),
+    cuts speech into segments and puts them on a queue for listen().
+    Other components (e.g. BargeIn) can tap the raw frames.
+
+    With partial listeners attached, the phrase recorded so far is also
+    transcribed every `partial_interval` seconds, and once more as soon as
+    `endpoint_silence` of quiet suggests the user is done. Listeners get
+    fn(text, stable); the endpoint hypothesis is the stable one.
+    """
+
+    def __init__(self, device_index=None, calibrate=0.5, pause_threshold=0.8, phrase_time_limit=None,
+                 min_phrase=0.3, energy_ratio=1.5, damping=0.15, transcribe=None,
+                 partial_interval=1.0, endpoint_silence=0.3):
+        self.device_index = device_index
+        self.calibrate = calibrate
+        self.pause_threshold = pause_threshold
+        self.phrase_time_limit = phrase_time_limit
+        self.min_phrase = min_phrase
+        self.energy_ratio = energy_ratio
+        self.damping = damping
+        self.transcribe = transcribe or make_stt().transcribe
+        self.partial_interval = partial_interval
+        self.endpoint_silence = min(endpoint_silence, pause_threshold)
+        self.energy_threshold = 300
+        self.segments = queue.Queue()
+        self.accept_after = 0.0
+        self._split = False  # set by next_segment(): cut the phrase being recorded at this point
+        self._taps = []
+        self._taps_lock = threading.Lock()
+        self._partial_listeners = []
+        self._partial_pool = None
+        self._partial_busy = False
+        self._listening = False
+        self._running = False
+        self.source = None
+
+    # --- 🎙 STREAM ---
+    def start(self):
+        self.source = sr.Microphone(device_index=self.device_index)
+        self.source.__enter__()
+        self.chunk_seconds = self.source.CHUNK / self.source.SAMPLE_RATE
+
+        # One-time ambient calibration
+        energies = [rms(self._read()) for _ in range(max(1, int(self.calibrate / self.chunk_seconds)))]
+        self.energy_threshold = self.energy_ratio * sum(energies) / len(energies)
+
+        self._running = True
+        threading.Thread(target=self._capture, daemon=True).start()
+        return self
+
+    def close(self):
+        self._running = False
+        if self.source:
+            self.source.__exit__(None, None, None)
+            self.source = None
+
+    def _read(self):
+        return self.source.stream.read(self.source.CHUNK)
+
+    @property
+    def sample_rate(self):
+        return self.source.SAMPLE_RATE
+
+    @property
+    def sample_width(self):
+        return self.source.SAMPLE_WIDTH
+
+    def add_tap(self, fn):
+        """fn(frame, energy) is called for every captured chunk"""
+        with self._taps_lock:
+            self._taps.append(fn)
+
+    def remove_tap(self, fn):
+        with self._taps_lock:
+            if fn in self._taps:
+                self._taps.remove(fn)
+
+    def add_partial_listener(self, fn):
+        """fn(text, stable) is called with hypotheses for the phrase being spoken"""
+        if not hears_audio(self.transcribe):
+            return  # a scripted backend can only answer the whole segment, once
+        if self._partial_pool is None:
+            self._partial_pool = ThreadPoolExecutor(max_workers=2)
+        self._partial_listeners.append(fn)
+
+    def _hypothesize(self, phrase, stable):
+        """Transcribes the phrase so far off the capture thread; returns a Future for the text (or None)"""
+        frames = list(phrase)
+        if not stable:
+            if self._partial_busy:
+                return None  # an interim hypothesis is still running; skip this one
+            self._partial_busy = True
+
+        def run():
+            try:
+                text = self.transcribe(sr.AudioData(b"".join(frames), self.sample_rate, self.sample_width))
+            except Exception:
+                text = None
+            finally:
+                if not stable:
+                    self._partial_busy = False
+            if text and self._listening:
+                print(f"   … {text}")
+                for fn in list(self._partial_listeners):
+                    try:
+                        fn(text, stable)
+                    except Exception as e:
+                        print(f"   ❌ Partial listener error: {e}")
+            return text
+
+        return self._partial_pool.submit(run)
+
+    def _capture(self):
+        preroll = deque(maxlen=max(1, int(0.3 / self.chunk_seconds)))
+        phrase = None
+        started_at = 0.0
+        silence = 0.0
+        last_partial = 0.0
+        endpoint = None
+        while self._running:
+            try:
+                frame = self._read()
+            except Exception as e:
+                print(f"   ❌ Microphone Error: {e}")
+                time.sleep(0.1)
+                continue
+            energy = rms(frame)
+            with self._taps_lock:
+                taps = list(self._taps)
+            for tap in taps:
+                tap(frame, energy)
+
+            if self._split:
+                # listen() just started. What was recorded so far is the agent's echo; drop it but keep
+                # recording, so a user who answers right away isn't merged into the echo and thrown out
+                self._split = False
+                preroll.clear()
+                if phrase is not None:
+                    phrase = []
+                    started_at = time.perf_counter() - self.chunk_seconds
+                    silence = 0.0
+                    last_partial = 0.0
+                    endpoint = None
+
+            if phrase is None:
+                if energy > self.energy_threshold:
+                    phrase = list(preroll) + [frame]
+                    started_at = time.perf_counter() - len(phrase) * self.chunk_seconds
+                    silence = 0.0
+                    last_partial = 0.0
+                    endpoint = None
+                else:
+                    # Rolling adaptation while nobody is talking
+                    damping = self.damping ** self.chunk_seconds
+                    target = energy * self.energy_ratio
+                    self.energy_threshold = self.energy_threshold * damping + target * (1 - damping)
+                    preroll.append(frame)
+                continue
+
+            phrase.append(frame)
+            if energy > self.energy_threshold:
+                silence = 0.0
+                endpoint = None  # speech resumed, the endpoint hypothesis is stale
+            else:
+                silence += self.chunk_seconds
+            length = len(phrase) * self.chunk_seconds
+
+            if self._partial_listeners and self._listening and length - silence >= self.min_phrase:
+                if endpoint is None and silence >= self.endpoint_silence:
+                    endpoint = self._hypothesize(phrase, stable=True)
+                elif silence == 0.0 and length - last_partial >= self.partial_interval:
+                    last_partial = length
+                    self._hypothesize(phrase, stable=False)
+
+            too_long = self.phrase_time_limit and length >= self.phrase_time_limit
+            if silence >= self.pause_threshold or too_long:
+                if length - silence >= self.min_phrase:
+                    audio = sr.AudioData(b"".join(phrase), self.sample_rate, self.sample_width)
+                    self.segments.put(SpeechSegment(audio, started_at, time.perf_counter(), endpoint))
+                phrase = None
+                preroll.clear()
+
+    # --- 👂 LISTEN ---
+    def next_segment(self, timeout=None, grace=0.2):
+        """Next speech segment that started after this call (minus `grace`); earlier ones were echo or stale"""
+        self.accept_after = time.perf_counter() - grace
+        self._split = True
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            try:
+                segment = self.segments.get(timeout=remaining)
+            except queue.Empty:
+                return None
+            if segment.started_at >= self.accept_after:
+                return segment
+
+    def listen(self, hint="\n👂 Listening...", timeout=None):
+        """Drop-in for listen_to_user(): returns the transcript of the next utterance"""
+        print(hint)
+        self._listening = True
+        try:
+            segment = self.next_segment(timeout)
+        finally:
+            self._listening = False
+        if segment is None:
+            return None
+        try:
+            # The endpoint hypothesis already covers every word of the segment; only trailing silence differs
+            text = segment.hypothesis.result() if segment.hypothesis else None
+            text = text or self.transcribe(segment.audio)
+        except sr.UnknownValueError:
+            return None
+        except Exception as e:
+            print(f"   ❌ STT Error: {e}")
+            return None
+        print(f"   👤 You: \"{text}\"")
+        return text
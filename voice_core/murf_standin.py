@@ -0,0 +1,95 @@
+"""
+Local stand-in for the Murf generate endpoint, for latency measurements.
+
+    python -m voice_core.murf_standin --port 8765
+    MURF_URL=http://127.0.0.1:8765/v1/speech/generate python day7_grocer.py
+"""
+import json
+import socket
+import time
+import uuid
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MurfStandIn:
+    """Fake Murf: synthesis time grows with text length, audio is served from memory"""
+
+    def __init__(self, host="127.0.0.1", port=0, base_latency=0.15, per_char=0.004):
+        self.base_latency = base_latency
+        self.per_char = per_char
+        self.clips = {}
+        self.requests = 0
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.host, self.port = self.server.server_address[:2]
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/v1/speech/generate"
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out in separate writes; don't let Nagle hold the body back
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body, content_type):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                standin.requests += 1
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                text = payload.get("text", "")
+                time.sleep(standin.base_latency + standin.per_char * len(text))
+                clip_id = uuid.uuid4().hex
+                # ID3 header + text keeps the fake clip size proportional to the sentence
+                standin.clips[clip_id] = b"ID3" + text.encode("utf-8")
+                body = json.dumps({"audioFile": f"http://{standin.host}:{standin.port}/audio/{clip_id}.mp3"})
+                self._send(200, body.encode("utf-8"), "application/json")
+
+            def do_GET(self):
+                clip_id = self.path.rsplit("/", 1)[-1].replace(".mp3", "")
+                clip = standin.clips.pop(clip_id, None)
+                if clip is None:
+                    self._send(404, b"not found", "text/plain")
+                else:
+                    self._send(200, clip, "audio/mpeg")
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Murf stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--base-latency", type=float, default=0.15)
+    parser.add_argument("--per-char", type=float, default=0.004)
+    args = parser.parse_args()
+
+    standin = MurfStandIn(port=args.port, base_latency=args.base_latency, per_char=args.per_char)
+    print(f"🎙 Murf stand-in listening at {standin.url}")
+    try:
+        standin.server.serve_forever()
+    except KeyboardInterrupt:
+        standin.stop()
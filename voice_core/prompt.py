@@ -0,0 +1,74 @@
+import json
+from collections import deque
+
+from .history import _field, count_tokens, message_text
+
+
+def static_prompt(*sections):
+    """System prompt from sections that never change during a session (role, rules, catalog, course content)"""
+    return "\n\n".join(section.strip() for section in sections if section)
+
+
+def state_message(**fields):
+    """Volatile state (mode, topic, player status...) as a trailing system message.
+
+    Sent after the history on every request instead of being baked into the
+    system prompt, so everything before it stays byte-identical between
+    requests and can be served from the provider's prompt cache.
+    """
+    lines = [f"{key.replace('_', ' ').upper()}: {value}" for key, value in fields.items() if value is not None]
+    return {"role": "system", "content": "CURRENT STATE:\n" + "\n".join(lines)}
+
+
+def serialize(messages, tools=None):
+    """The request roughly as the provider tokenizes it: tool definitions first, then each message"""
+    parts = [json.dumps(tools, sort_keys=True)] if tools else []
+    parts += [f"<{_field(m, 'role')}>{message_text(m)}" for m in messages]
+    return "\n".join(parts)
+
+
+class PrefixTracker:
+    """Measures how much of each request repeats the start of a recent one (what prefix caching can reuse).
+
+    OpenAI caches prompts from 1024 tokens on, in 128-token steps; the
+    reported prefix is the raw shared length.
+    """
+
+    def __init__(self, remember=8):
+        self.recent = deque(maxlen=remember)
+        self.requests = 0
+        self.total_tokens = 0
+        self.prefix_tokens = 0
+
+    def observe(self, messages, tools=None):
+        """Records one request; returns (cacheable prefix tokens, total tokens)"""
+        text = serialize(messages, tools)
+        shared = max((self._common(text, earlier) for earlier in self.recent), default=0)
+        self.recent.append(text)
+        prefix, total = count_tokens(text[:shared]), count_tokens(text)
+        self.requests += 1
+        self.total_tokens += total
+        self.prefix_tokens += prefix
+        return prefix, total
+
+    @staticmethod
+    def _common(a, b):
+        n = min(len(a), len(b))
+        if a[:n] == b[:n]:
+            return n
+        lo, hi = 0, n
+        while lo < hi:  # binary search on slice equality: C-speed compares instead of a Python loop
+            mid = (lo + hi + 1) // 2
+            if a[:mid] == b[:mid]:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "total_tokens": self.total_tokens,
+            "prefix_tokens": self.prefix_tokens,
+            "prefix_ratio": self.prefix_tokens / self.total_tokens if self.total_tokens else None
+        }
@@ -0,0 +1,138 @@
+import os
+import re
+import json
+import math
+import hashlib
+from collections import Counter
+
+_WORD = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset("""
+a an and are as at be but by can could do does for from get give have how i if im in into is it its just
+let me more my of on or our please so some tell than that the their them then there these this to us
+want was we what when where which who why will with would you your
+""".split())
+
+
+def stem(word):
+    """Folds plurals so 'loops' finds 'loop' and 'hoodies' finds 'hoody'"""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def tokenize(text):
+    return [stem(w) for w in _WORD.findall(text.lower()) if w not in STOPWORDS]
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class BM25Index:
+    """Inverted index with BM25 ranking over weighted text fields.
+
+    Build it once (add() per document), then search() only touches the
+    postings of the query's terms. save()/load() persist it as JSON,
+    stamped with the hash of the source it was built from.
+    """
+
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.keys = []        # doc number -> caller's key
+        self.lengths = []     # doc number -> weighted token count
+        self.postings = {}    # term -> {doc number: weighted term frequency}
+        self._norms = None    # per-document length normalization, cached until the next add()
+
+    def add(self, key, fields):
+        """Indexes one document; `fields` is a list of (text, weight)"""
+        doc = len(self.keys)
+        counts = Counter()
+        for text, weight in fields:
+            for term in tokenize(text or ""):
+                counts[term] += weight
+        self.keys.append(key)
+        self.lengths.append(sum(counts.values()))
+        self._norms = None
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[doc] = tf
+        return doc
+
+    def __len__(self):
+        return len(self.keys)
+
+    def idf(self, term):
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.keys) - df + 0.5) / (df + 0.5))
+
+    def scores(self, query, candidates=None):
+        """{doc number: score} for documents matching any query term (optionally only within `candidates`).
+
+        `query` is text, or a list of already tokenized terms.
+        """
+        if not self.keys:
+            return {}
+        if self._norms is None:
+            average = sum(self.lengths) / len(self.lengths) or 1.0
+            self._norms = [self.k1 * (1 - self.b + self.b * length / average) for length in self.lengths]
+        norms = self._norms
+        k1 = self.k1 + 1
+        scores = {}
+        for term in set(tokenize(query) if isinstance(query, str) else query):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for doc, tf in postings.items():
+                if candidates is not None and doc not in candidates:
+                    continue
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * k1 / (tf + norms[doc])
+        return scores
+
+    def search(self, query, limit=5, candidates=None):
+        """Best matches first, as (key, score)"""
+        ranked = sorted(self.scores(query, candidates).items(), key=lambda item: (-item[1], item[0]))
+        return [(self.keys[doc], score) for doc, score in ranked[:limit]]
+
+    # --- 💾 PERSISTENCE ---
+    def save(self, path, source_hash=None):
+        data = {"source_hash": source_hash, "k1": self.k1, "b": self.b, "keys": self.keys,
+                "lengths": self.lengths, "postings": self.postings}
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, source_hash=None):
+        """The saved index, or None if it is missing or was built from a different source"""
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if source_hash is not None and data.get("source_hash") != source_hash:
+            return None
+        index = cls(data["k1"], data["b"])
+        index.keys = data["keys"]
+        index.lengths = data["lengths"]
+        # JSON object keys are strings; doc numbers are ints
+        index.postings = {term: {int(doc): tf for doc, tf in docs.items()} for term, docs in data["postings"].items()}
+        return index
+
+    @classmethod
+    def cached(cls, index_path, source_path, build):
+        """Loads the index persisted for `source_path`, or calls build() and saves the result"""
+        source_hash = file_hash(source_path) if os.path.exists(source_path) else None
+        index = cls.load(index_path, source_hash) if source_hash else None
+        if index is None:
+            index = build()
+            if source_hash:
+                try:
+                    index.save(index_path, source_hash)
+                except OSError as e:
+                    print(f"   ❌ Index Save Error: {e}")
+        return index
@@ -0,0 +1,231 @@
+import threading
+
+from .stt import listen_to_user
+from .tts import stream_sentences
+from .speculate import Speculator, normalize_transcript
+from .history import HistoryManager
+from .prompt import state_message
+from .tools import ToolRegistry, is_error
+
+
+class VoiceSession:
+    """One agent conversation: listen -> LLM (+ tools) -> speak, until an exit word or a final tool"""
+
+    def __init__(self, system_prompt, speaker, llm, tools=None, name="Agent", listen=listen_to_user,
+                 exit_words=("bye",), farewell="Goodbye!", on_exit=None, barge_in=None, speculate=False,
+                 stream_llm=False, memory=None, state=None, mic=None, hint="\n👂 Listening..."):
+        self.speaker = speaker
+        self.llm = llm
+        self.tools = tools or ToolRegistry()
+        self.name = name
+        # A LiveMicrophone (mic=) replaces `listen`, prompting with `hint` before each turn
+        self.listen = (lambda: mic.listen(hint)) if mic else listen
+        self.exit_words = exit_words
+        self.farewell = farewell
+        self.on_exit = on_exit
+        self.barge_in = barge_in  # a BargeIn monitor lets the user talk over the agent
+        self.voice_id = None  # None -> the speaker's default voice
+        self.history = []
+        self.active = True
+        self.playback = None  # the reply currently being spoken
+        # With speculate=True the first LLM call starts at the endpoint, from the mic's partial transcripts
+        self.speculator = Speculator() if speculate else None
+        if mic and speculate:
+            mic.add_partial_listener(self.on_partial)
+        # With stream_llm=True spoken replies are streamed from the LLM and voiced sentence by sentence
+        self.stream_llm = stream_llm
+        # memory=None keeps the history under the default token budget, memory=False lets it grow
+        self.memory = HistoryManager(llm) if memory is None else memory
+        # state() -> dict of volatile fields, sent after the history so the prompt prefix stays cacheable
+        self.state = state
+        # Turns answered straight from tool results, and LLM calls that saved
+        self.direct_replies = 0
+        self.llm_calls_saved = 0
+        self.reset(system_prompt)
+
+    def messages(self, extra=()):
+        """What is sent to the LLM: the history (plus `extra`), then the current state"""
+        # "polished" is ours, not the API's: send the content the user actually heard
+        history = [{k: v for k, v in m.items() if k != "polished"} if isinstance(m, dict) and "polished" in m else m
+                   for m in self.history]
+        messages = history + list(extra)
+        if self.state:
+            messages.append(state_message(**self.state()))
+        return messages
+
+    def reset(self, system_prompt):
+        """Starts a fresh history with a new system prompt"""
+        self.history = [{"role": "system", "content": system_prompt}]
+
+    def say(self, text, remember=True):
+        """Starts speaking without blocking; the next listen() waits for the audio to end"""
+        self.wait_for_playback()
+        print(f"   🤖 {self.name}: \"{text}\"")
+        self.playback = self.speaker.speak_async(text, voice_id=self.voice_id)
+        if remember:
+            self.history.append({"role": "assistant", "content": text})
+
+    def say_stream(self, deltas):
+        """Speaks a streamed LLM reply as each sentence completes; history gets the text that was spoken"""
+        self.wait_for_playback()
+        entry = {"role": "assistant", "content": ""}
+        self.history.append(entry)
+
+        def sentences():
+            for sentence in stream_sentences(deltas):
+                print(f"   🤖 {self.name}: \"{sentence}\"")
+                yield sentence
+
+        def record(utterance):
+            if utterance.text:
+                entry["content"] = utterance.text
+            else:
+                self.history = [m for m in self.history if m is not entry]
+
+        self.playback = self.speaker.speak_stream(sentences(), voice_id=self.voice_id)
+        self.playback.add_done_callback(record)
+
+    def reply(self):
+        """Speaks the LLM's next reply to the history (tools are sent but can't be called)"""
+        if self.stream_llm:
+            self.say_stream(self.llm.stream(self.messages(), self.tools.schema))
+        else:
+            self.say(self.llm.chat(self.messages(), self.tools.schema, tool_choice="none").content)
+
+    def polish(self, entry, messages):
+        """Lets the LLM rephrase a direct tool reply, off the critical path; kept next to the spoken text"""
+        def run():
+            try:
+                entry["polished"] = self.llm.chat(messages, self.tools.schema, tool_choice="none").content
+            except Exception as e:
+                print(f"   ❌ Polish Error: {e}")
+        threading.Thread(target=run, daemon=True).start()
+
+    def stats(self):
+        return {
+            "llm_calls": self.llm.calls,
+            "direct_replies": self.direct_replies,
+            "llm_calls_saved": self.llm_calls_saved
+        }
+
+    def wait_for_playback(self):
+        if self.playback:
+            self.playback.wait()
+            self.playback = None
+
+    def next_user_turn(self):
+        """The user's next utterance: an interruption of the current reply, or a normal listen()"""
+        if self.barge_in and self.playback:
+            playback, self.playback = self.playback, None
+            interruption = self.barge_in.watch(playback)
+            if interruption:
+                return interruption
+            playback.wait()
+        # Reopen the microphone the moment the reply finishes playing
+        self.wait_for_playback()
+        return self.listen()
+
+    def _turn_key(self, user_text):
+        # A speculation is only valid for the same words on the same history (before_turn may rewrite it)
+        state = self.state() if self.state else None
+        return normalize_transcript(user_text), len(self.history), self.history[0]["content"], repr(state)
+
+    def on_partial(self, text, stable):
+        """Partial-transcript listener: starts the first LLM call on a stable hypothesis"""
+        if not (self.speculator and stable and self.active) or self.wants_exit(text):
+            return
+        messages = self.messages([{"role": "user", "content": text}])
+        self.speculator.start(self._turn_key(text), self.llm.chat, messages, self.tools.schema)
+
+    def speculative_reply(self, key):
+        """The speculative answer to the latest user turn if it was made for `key`, else None"""
+        if not self.speculator:
+            return None
+        msg = self.speculator.take(key)
+        if msg is not None:
+            print("   ⚡ Reusing speculative reply")
+        return msg
+
+    def end(self, text=None):
+        if text:
+            self.say(text, remember=False)
+        self.active = False
+
+    def wants_exit(self, user_text):
+        lower = user_text.lower()
+        return any(word in lower for word in self.exit_words)
+
+    def handle(self, user_text):
+        """Runs one user turn through the LLM and any tool calls, then speaks the reply"""
+        if self.wants_exit(user_text):
+            if self.speculator:
+                self.speculator.discard()
+            if self.on_exit:
+                self.on_exit()
+            self.end(self.farewell)
+            return
+
+        key = self._turn_key(user_text)
+        self.history.append({"role": "user", "content": user_text})
+        print("   🧠 Thinking...")
+        try:
+            msg = self.speculative_reply(key)
+            if msg is None and self.stream_llm and not len(self.tools):
+                self.reply()
+                return
+            msg = msg or self.llm.chat(self.messages(), self.tools.schema)
+            if not msg.tool_calls:
+                self.say(msg.content)
+                return
+
+            # The tool_calls message goes into the history only with its results: a call without a
+            # "tool" reply makes the API reject every later request
+            results = self.tools.dispatch_all(msg.tool_calls)
+            self.history.append(msg)
+            final_result = None
+            direct = []
+            for call, result in zip(msg.tool_calls, results):
+                self.history.append({"role": "tool", "tool_call_id": call.id, "content": str(result)})
+                # A final tool that failed (bad arguments, exception) goes back to the LLM instead of ending the call
+                if self.tools.is_final(call.function.name) and not is_error(result):
+                    final_result = result
+                direct.append(self.tools.render(call, result))
+            if final_result is not None:
+                self.end(str(final_result))
+                return
+
+            if all(direct):
+                # Every result is already speakable: skip the follow-up round trip
+                messages = self.messages()
+                self.say(" ".join(direct))
+                self.direct_replies += 1
+                if any(self.tools.wants_polish(call.function.name) for call in msg.tool_calls):
+                    self.polish(self.history[-1], messages)
+                else:
+                    self.llm_calls_saved += 1
+                return
+
+            self.reply()
+        except Exception as e:
+            print(f"   ❌ OpenAI Error: {e}")
+
+    def run(self, intro=None, keep_going=None, before_turn=None):
+        """Main loop. `before_turn(session, user_text)` can adjust prompt/voice before each turn."""
+        if intro:
+            self.say(intro)
+        while self.active and (keep_going is None or keep_going()):
+            if self.memory:
+                self.memory.apply(self.history)
+            user_text = self.next_user_turn()
+            if not user_text:
+                continue
+            if before_turn:
+                before_turn(self, user_text)
+            self.handle(user_text)
+            if self.memory:
+                # Summarizes old turns in the background while the reply plays
+                self.memory.maintain(self.history)
+        self.wait_for_playback()
+        if self.direct_replies:
+            stats = self.stats()
+            print(f"   📊 LLM calls: {stats['llm_calls']} ({stats['llm_calls_saved']} saved by direct tool replies)")
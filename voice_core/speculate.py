@@ -0,0 +1,63 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+
+def normalize_transcript(text):
+    """Case/punctuation-insensitive form used to compare a partial with the final transcript"""
+    return " ".join(re.sub(r"[^\w\s']", " ", text.lower()).split())
+
+
+class Speculator:
+    """Runs one request ahead of time and hands the result over only if it was made for the right input.
+
+    Start it on a stable partial transcript; when the final transcript is in,
+    take() returns the result for a matching key or None, in which case the
+    caller simply reissues the request. A stale speculation is cancelled if it
+    has not started yet and otherwise just ignored.
+    """
+
+    def __init__(self, workers=2):
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.pending = None  # (key, future)
+        self.hits = 0
+        self.misses = 0
+        self.wasted = 0  # speculative requests that ran but were thrown away
+
+    def start(self, key, fn, *args):
+        if self.pending and self.pending[0] == key:
+            return
+        self.discard()
+        self.pending = (key, self.pool.submit(fn, *args))
+
+    def discard(self):
+        pending, self.pending = self.pending, None
+        if pending and not pending[1].cancel():
+            self.wasted += 1
+
+    def take(self, key):
+        """The speculative result for `key`, or None if there is none (or it failed)"""
+        pending, self.pending = self.pending, None
+        if pending is None:
+            return None
+        if pending[0] != key:
+            self.pending = pending
+            self.discard()
+            self.misses += 1
+            return None
+        try:
+            result = pending[1].result()
+        except Exception as e:
+            print(f"   ❌ Speculative request failed: {e}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def stats(self):
+        attempts = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "wasted": self.wasted,
+            "hit_rate": self.hits / attempts if attempts else None
+        }
@@ -0,0 +1,136 @@
+import os
+import time
+import threading
+
+import speech_recognition as sr
+
+# "google" (default), "whisper" (offline, CPU) or "scripted:<path>" (deterministic stand-in)
+STT_BACKEND = os.getenv("STT_BACKEND", "google")
+
+
+# --- 🧩 BACKENDS ---
+# Every backend has transcribe(audio: sr.AudioData) -> str and raises
+# sr.UnknownValueError when it heard nothing usable. One that ignores the
+# audio sets hears_audio = False.
+
+class GoogleSTT:
+    """Google Web Speech through speech_recognition (network round trip)"""
+
+    name = "google"
+
+    def __init__(self, language="en-US"):
+        self.language = language
+        self.recognizer = sr.Recognizer()
+
+    def transcribe(self, audio):
+        return self.recognizer.recognize_google(audio, language=self.language)
+
+
+class WhisperSTT:
+    """Local faster-whisper model on the CPU; no network needed once the model is downloaded"""
+
+    name = "whisper"
+
+    def __init__(self, model_size="base.en", device="cpu", compute_type="int8", beam_size=1):
+        from faster_whisper import WhisperModel  # optional dependency: pip install faster-whisper
+        import numpy as np
+        self.np = np
+        self.model = WhisperModel(model_size, device=device, compute_type=compute_type)
+        self.beam_size = beam_size
+
+    def transcribe(self, audio):
+        pcm = audio.get_raw_data(convert_rate=16000, convert_width=2)
+        samples = self.np.frombuffer(pcm, dtype=self.np.int16).astype(self.np.float32) / 32768.0
+        segments, _ = self.model.transcribe(samples, beam_size=self.beam_size, language="en")
+        text = " ".join(segment.text.strip() for segment in segments).strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+class ScriptedSTT:
+    """Deterministic stand-in: replays transcripts from a text file (one per line) or a list.
+
+    Ignores the audio, so it also works as a listener without any microphone:
+        session = VoiceSession(..., listen=ScriptedSTT.from_file("script.txt").listen)
+    """
+
+    name = "scripted"
+    hears_audio = False  # every transcribe() is the next line, so partials and barge-in would skip script lines
+
+    def __init__(self, lines, latency=0.0):
+        self.lines = list(lines)
+        self.latency = latency
+        self.position = 0
+
+    @classmethod
+    def from_file(cls, path, latency=0.0):
+        with open(path, "r") as f:
+            return cls([line.strip() for line in f if line.strip()], latency)
+
+    def transcribe(self, audio=None):
+        if self.latency:
+            time.sleep(self.latency)
+        if self.position >= len(self.lines):
+            raise sr.UnknownValueError()
+        text = self.lines[self.position]
+        self.position += 1
+        return text
+
+    def listen(self, hint=None):
+        try:
+            text = self.transcribe()
+        except sr.UnknownValueError:
+            return None
+        print(f"   👤 You: \"{text}\"")
+        return text
+
+
+def hears_audio(transcribe):
+    """False if `transcribe` belongs to a backend that ignores the audio it is given"""
+    return getattr(getattr(transcribe, "__self__", None), "hears_audio", True)
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def make_stt(kind=STT_BACKEND):
+    """One shared backend per kind, so the microphone and barge-in use the same model (or script)"""
+    with _backends_lock:
+        if kind not in _backends:
+            if kind == "whisper":
+                _backends[kind] = WhisperSTT()
+            elif kind.startswith("scripted:"):
+                _backends[kind] = ScriptedSTT.from_file(kind.split(":", 1)[1])
+            else:
+                _backends[kind] = GoogleSTT()
+        return _backends[kind]
+
+
+# --- 👂 ONE-SHOT LISTEN ---
+def listen_to_user(hint="\n👂 Listening...", timeout=8, phrase_time_limit=None, calibrate=0.5,
+                   pause_threshold=None, energy_threshold=None, stt=None):
+    """Records one utterance from the microphone and returns the transcript (None if nothing usable)"""
+    stt = stt or make_stt()
+    recognizer = sr.Recognizer()
+    if pause_threshold is not None:
+        recognizer.pause_threshold = pause_threshold
+    if energy_threshold is not None:
+        recognizer.energy_threshold = energy_threshold
+        recognizer.dynamic_energy_threshold = True
+
+    with sr.Microphone() as source:
+        print(hint)
+        recognizer.adjust_for_ambient_noise(source, duration=calibrate)
+        try:
+            audio = recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+            text = stt.transcribe(audio)
+        except (sr.WaitTimeoutError, sr.UnknownValueError):
+            return None
+        except Exception as e:
+            print(f"   ❌ STT Error: {e}")
+            return None
+
+    print(f"   👤 You: \"{text}\"")
+    return text
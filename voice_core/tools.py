@@ -0,0 +1,278 @@
+import json
+import math
+import time
+import inspect
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor, wait
+
+_JSON_TYPES = {str: "string", int: "integer", float: "number", bool: "boolean", list: "array", dict: "object"}
+
+
+def _json_type(annotation):
+    """JSON schema for a parameter annotation (str, int, Optional[int], Literal["a", "b"], list[str], ...)"""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Literal:
+        values = typing.get_args(annotation)
+        return {"type": _JSON_TYPES.get(type(values[0]), "string"), "enum": list(values)}
+    if origin is typing.Union:
+        # Optional[X] -> X
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return _json_type(args[0]) if args else {"type": "string"}
+    if origin is list:
+        args = typing.get_args(annotation)
+        return {"type": "array", "items": _json_type(args[0]) if args else {"type": "string"}}
+    return {"type": _JSON_TYPES.get(annotation, "string")}
+
+
+def schema_from_signature(func, describe=None):
+    """OpenAI parameters schema built from a function's signature: type hints give types, defaults make args optional"""
+    describe = describe or {}
+    properties = {}
+    required = []
+    for param in inspect.signature(func).parameters.values():
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        prop = _json_type(param.annotation) if param.annotation is not param.empty else {"type": "string"}
+        if param.name in describe:
+            prop["description"] = describe[param.name]
+        properties[param.name] = prop
+        if param.default is param.empty:
+            required.append(param.name)
+    return {"type": "object", "properties": properties, "required": required}
+
+
+def _coerce(value, prop):
+    """Converts one argument to its schema type; raises ValueError if it can't"""
+    kind = prop.get("type")
+    if value is None:
+        return None
+    if kind == "integer":
+        if isinstance(value, bool):
+            raise ValueError("expected an integer")
+        if isinstance(value, str):
+            value = float(value.strip().replace(",", ""))
+        if not math.isfinite(float(value)):
+            raise ValueError(f"expected a number, got {value}")
+        if float(value) != int(float(value)):
+            raise ValueError(f"expected a whole number, got {value}")
+        value = int(float(value))
+    elif kind == "number":
+        if isinstance(value, bool):
+            raise ValueError("expected a number")
+        if isinstance(value, str):
+            value = value.strip().lstrip("$₹€£").replace(",", "")
+        value = float(value)
+        if not math.isfinite(value):
+            raise ValueError(f"expected a number, got {value}")
+        value = int(value) if value.is_integer() else value
+    elif kind == "boolean":
+        if isinstance(value, str):
+            if value.strip().lower() not in ("true", "false", "yes", "no"):
+                raise ValueError(f"expected true or false, got {value!r}")
+            value = value.strip().lower() in ("true", "yes")
+        value = bool(value)
+    elif kind == "string":
+        value = str(value)
+    elif kind == "array":
+        if not isinstance(value, list):
+            value = [value]
+        if "items" in prop:
+            value = [_coerce(item, prop["items"]) for item in value]
+    if "enum" in prop and value not in prop["enum"]:
+        raise ValueError(f"must be one of {prop['enum']}, got {value!r}")
+    return value
+
+
+def validate(parameters, args, enforce_required=True):
+    """Coerces `args` to the parameters schema; returns (args, errors)"""
+    properties = parameters.get("properties", {})
+    clean = {}
+    errors = []
+    for key, value in args.items():
+        if value is None:
+            continue  # an explicit null leaves the function's default in place (required ones are caught below)
+        if key not in properties:
+            continue  # the model invented an argument; drop it rather than pass it on (even to **kwargs tools)
+        try:
+            clean[key] = _coerce(value, properties[key])
+        except (TypeError, ValueError, OverflowError) as e:
+            errors.append(f"{key}: {e}")
+    for key in parameters.get("required", []) if enforce_required else ():
+        if args.get(key) is None:
+            errors.append(f"{key}: missing")
+    return clean, errors
+
+
+def is_error(result):
+    """True for a result that reports a failure: an "Error: ..." string or a dict with an "error" key"""
+    return (isinstance(result, str) and result.startswith("Error:")) or (isinstance(result, dict) and "error" in result)
+
+
+class ToolRegistry:
+    """Maps tool names to Python functions and their OpenAI function schemas.
+
+    The schema is generated from the function's signature when it is
+    registered (pass `parameters` to spell it out instead, `describe` to
+    document arguments). Arguments from the model are checked and coerced
+    against it before the call, and every tool keeps call/error/latency
+    counters (stats()). With enforce_required=False the schema's `required`
+    list only guides the model; a call missing those arguments still runs.
+
+    A tool registered with `speak` has a direct response: its result is
+    rendered into the spoken reply, so no second LLM call is needed to phrase
+    it. `speak` is True (say the result as is), a format string over the
+    call's arguments plus {result}, or fn(result, args) -> text (None to fall
+    back to the LLM). With polish=True the LLM also phrases the reply, in
+    the background; the history keeps what was spoken, with the LLM's
+    version next to it (entry["polished"]).
+
+    Several calls in one turn run concurrently (dispatch_all). Tools that
+    touch shared state declare it with `conflicts` (e.g. ("cart",)); calls
+    sharing a name run one after another in the order the model asked.
+    """
+
+    def __init__(self, workers=4):
+        self._tools = {}
+        self.workers = workers
+        self._pool = None
+        self._stats_lock = threading.Lock()
+
+    def register(self, func, description, parameters=None, name=None, final=False, speak=None, polish=False,
+                 conflicts=(), describe=None, enforce_required=True):
+        """Adds `func` as a tool. A `final` tool's result is spoken and ends the session (unless it is an error)."""
+        name = name or func.__name__
+        parameters = parameters or schema_from_signature(func, describe)
+        self._tools[name] = {
+            "func": func,
+            "final": final,
+            "speak": speak,
+            "polish": polish,
+            "conflicts": set(conflicts),
+            "enforce_required": enforce_required,
+            "stats": {"calls": 0, "errors": 0, "seconds": 0.0, "max_seconds": 0.0},
+            "schema": {
+                "type": "function",
+                "function": {
+                    "name": name,
+                    "description": description,
+                    "parameters": parameters
+                }
+            }
+        }
+        return func
+
+    def tool(self, description, parameters=None, **options):
+        """Decorator form of register()"""
+        def decorator(func):
+            return self.register(func, description, parameters, **options)
+        return decorator
+
+    def __len__(self):
+        return len(self._tools)
+
+    @property
+    def schema(self):
+        return [t["schema"] for t in self._tools.values()]
+
+    def is_final(self, name):
+        return name in self._tools and self._tools[name]["final"]
+
+    def wants_polish(self, name):
+        return name in self._tools and self._tools[name]["polish"]
+
+    def render(self, call, result):
+        """The direct spoken response for a finished tool call, or None if the LLM has to phrase it"""
+        tool = self._tools.get(call.function.name)
+        if not tool or not tool["speak"]:
+            return None
+        if is_error(result):
+            return None
+        speak = tool["speak"]
+        try:
+            args = json.loads(call.function.arguments or "{}")
+            if callable(speak):
+                return speak(result, args)
+            if speak is True:
+                return str(result)
+            fields = dict(result) if isinstance(result, dict) else {}
+            return speak.format(result=result, **{**fields, **args})
+        except Exception as e:
+            print(f"   ❌ Direct Response Error ({call.function.name}): {e}")
+            return None
+
+    def call(self, name, args):
+        tool = self._tools.get(name)
+        if not tool:
+            return f"Error: unknown tool '{name}'"
+        if not isinstance(args, dict):
+            self._record(tool, 0.0, failed=True)
+            return "Error: arguments must be a JSON object"
+        args, errors = validate(tool["schema"]["function"]["parameters"], args, tool["enforce_required"])
+        if errors:
+            self._record(tool, 0.0, failed=True)
+            return f"Error: invalid arguments for '{name}': {'; '.join(errors)}"
+        started = time.perf_counter()
+        try:
+            result = tool["func"](**args)
+        except Exception as e:
+            self._record(tool, time.perf_counter() - started, failed=True)
+            print(f"   ❌ Tool Error ({name}): {e}")
+            return f"Error: {e}"
+        self._record(tool, time.perf_counter() - started)
+        return result
+
+    def _record(self, tool, seconds, failed=False):
+        with self._stats_lock:
+            stats = tool["stats"]
+            stats["calls"] += 1
+            stats["errors"] += failed
+            stats["seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+    def stats(self):
+        """Per-tool call count, error count and latency"""
+        with self._stats_lock:
+            return {
+                name: {
+                    "calls": t["stats"]["calls"],
+                    "errors": t["stats"]["errors"],
+                    "mean_ms": 1000 * t["stats"]["seconds"] / t["stats"]["calls"] if t["stats"]["calls"] else None,
+                    "max_ms": 1000 * t["stats"]["max_seconds"]
+                }
+                for name, t in self._tools.items()
+            }
+
+    def dispatch(self, call):
+        """Runs an OpenAI tool call and returns its result"""
+        name = call.function.name
+        try:
+            args = json.loads(call.function.arguments or "{}")
+        except json.JSONDecodeError as e:
+            return f"Error: bad arguments for '{name}': {e}"
+        print(f"   ⚙ Executing {name}({args})")
+        return self.call(name, args)
+
+    def conflicts(self, name):
+        tool = self._tools.get(name)
+        return tool["conflicts"] if tool else set()
+
+    def dispatch_all(self, calls):
+        """Runs a turn's tool calls concurrently; returns their results in the order of `calls`"""
+        if len(calls) < 2:
+            return [self.dispatch(call) for call in calls]
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+
+        futures = []
+        for i, call in enumerate(calls):
+            # Wait for every earlier call that touches the same shared state
+            shared = self.conflicts(call.function.name)
+            before = [futures[j] for j in range(i) if shared & self.conflicts(calls[j].function.name)]
+            futures.append(self._pool.submit(self._dispatch_after, before, call))
+        return [future.result() for future in futures]
+
+    def _dispatch_after(self, before, call):
+        # Earlier calls were submitted first, so they are already running or done; this cannot deadlock
+        wait(before)
+        return self.dispatch(call)
@@ -0,0 +1,258 @@
+import os
+import re
+import time
+import threading
+from concurrent.futures import Future
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .audio import Playback, make_sink
+from .cache import cache_key, default_cache
+
+# --- 🗣 MURF CONFIG ---
+# MURF_URL can be pointed at a local stand-in (see voice_core/murf_standin.py)
+MURF_URL = os.getenv("MURF_URL", "https://api.murf.ai/v1/speech/generate")
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(text, min_chars=20):
+    """Splits a reply into sentence chunks, merging tiny fragments into the next one"""
+    parts = [p.strip() for p in _SENTENCE_END.split(text.strip()) if p.strip()]
+    chunks = []
+    pending = ""
+    for part in parts:
+        pending = f"{pending} {part}".strip()
+        if len(pending) >= min_chars:
+            chunks.append(pending)
+            pending = ""
+    if pending:
+        if chunks and len(pending) < min_chars:
+            chunks[-1] = f"{chunks[-1]} {pending}"
+        else:
+            chunks.append(pending)
+    return chunks
+
+
+def stream_sentences(deltas, min_chars=20):
+    """Cuts streamed text (e.g. LLM deltas) into sentence chunks as soon as each one is complete"""
+    pending = ""
+    for delta in deltas:
+        pending += delta
+        while True:
+            # A boundary only counts once the next word has started, so "3.5" or "Mr." mid-stream stay whole
+            cut = next((m for m in _SENTENCE_END.finditer(pending) if len(pending[:m.start()].strip()) >= min_chars),
+                       None)
+            if cut is None:
+                break
+            yield pending[:cut.start()].strip()
+            pending = pending[cut.end():]
+    if pending.strip():
+        yield pending.strip()
+
+
+class MurfClient:
+    """Connection-pooled Murf client.
+
+    One keep-alive requests.Session is shared by the generate call and the
+    audio download, so repeat turns skip the TCP+TLS handshake.
+    """
+
+    def __init__(self, api_key, murf_url=MURF_URL, pool_size=4, timeout=(3.05, 20), retries=2, backoff=0.3,
+                 model_version="GEN2", audio_format="MP3", cache=None):
+        self.api_key = api_key
+        self.murf_url = murf_url
+        self.timeout = timeout
+        self.model_version = model_version
+        self.audio_format = audio_format
+        self.cache = cache
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        retry = Retry(total=retries, backoff_factor=backoff, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=None)  # None -> retry POST too
+        self.adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        self.session.headers.update({"api-key": api_key, "Content-Type": "application/json"})
+
+    def synthesize(self, text, voice_id, persist=False):
+        """Returns the clip for `text`, from the cache when this exact line was spoken before.
+
+        Only persist=True (warmed, static lines) writes the clip to disk; LLM replies can carry
+        customer details, so by default they are kept in memory only.
+        """
+        if self.cache is None:
+            return self.fetch(text, voice_id)
+        key = cache_key(voice_id, self.model_version, self.audio_format, text)
+        audio = self.cache.get(key)
+        if audio is not None:
+            return audio
+
+        # If a warm-up thread is already fetching this line, wait for it instead of asking twice
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._inflight[key] = Future()
+        if not owner:
+            return pending.result()
+        try:
+            audio = self.fetch(text, voice_id)
+            self.cache.put(key, audio, persist)
+            pending.set_result(audio)
+            return audio
+        except Exception as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def fetch(self, text, voice_id):
+        """Asks Murf for one clip and downloads the audio bytes"""
+        payload = {"voiceId": voice_id, "text": text, "modelVersion": self.model_version, "format": self.audio_format}
+        res = self.session.post(self.murf_url, json=payload, timeout=self.timeout)
+        if res.status_code != 200:
+            raise RuntimeError(f"Murf Error: {res.status_code} - {res.text}")
+        audio_url = res.json().get("audioFile")
+        if not audio_url:
+            raise RuntimeError("Murf didn't send an audio link.")
+        audio = self.session.get(audio_url, timeout=self.timeout)
+        audio.raise_for_status()
+        return audio.content
+
+    def stats(self):
+        """Requests sent vs TCP connections opened across every pooled host"""
+        pools = self.adapter.poolmanager.pools
+        requests_sent = connections = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                requests_sent += pool.num_requests
+                connections += pool.num_connections
+        return {"requests": requests_sent, "connections": connections,
+                "reused": max(requests_sent - connections, 0)}
+
+    def close(self):
+        self.session.close()
+
+
+class Utterance(Playback):
+    """Playback handle for a whole reply; stopping it stops every sentence clip"""
+
+    def __init__(self, text):
+        super().__init__()
+        self.text = text
+        self.clips = []
+        self.time_to_first_audio = None
+
+    def stop(self):
+        super().stop()
+        for clip in list(self.clips):
+            clip.stop()
+        # Don't make the caller wait for a sentence that is still being synthesized
+        self._finish()
+
+
+class Speaker:
+    """Turns text into audio for one agent voice.
+
+    With stream=True a reply is spoken sentence by sentence, synthesizing the
+    next sentence while the current one plays. A custom synth(text, voice_id,
+    persist=False) stands in for the Murf client's synthesize.
+    """
+
+    def __init__(self, voice_id, api_key=None, murf_url=MURF_URL, synth=None, sink=None,
+                 stream=True, client=None, cache=None):
+        self.voice_id = voice_id
+        if client is None:
+            # cache=None shares the process-wide clip cache, cache=False turns caching off
+            if cache is None:
+                cache = default_cache()
+            client = MurfClient(api_key, murf_url, cache=cache or None)
+        self.client = client
+        self.synth = synth or self.client.synthesize
+        self._sink = sink
+        self._sink_lock = threading.Lock()
+        self.stream = stream
+        # Seconds from speak() to the first clip starting, for the last utterance
+        self.last_time_to_first_audio = None
+
+    @property
+    def sink(self):
+        """The audio output, opened on first play: importing an agent to warm its cache needs no sound device"""
+        if self._sink is None:
+            with self._sink_lock:
+                if self._sink is None:
+                    self._sink = make_sink()
+        return self._sink
+
+    def chunks(self, text):
+        """The pieces speak() will synthesize for `text`"""
+        return split_sentences(text) if self.stream else [text]
+
+    def prepare(self, text, voice_id=None, persist=True):
+        """Synthesizes `text` without playing it, so a later speak() is served from the cache"""
+        for chunk in self.chunks(text):
+            self.synth(chunk, voice_id or self.voice_id, persist=persist)
+
+    def speak_async(self, text, voice_id=None):
+        """Starts speaking `text` and returns an Utterance that completes when the audio ends"""
+        return self._speak(Utterance(text), self.chunks(text), voice_id)
+
+    def speak_stream(self, chunks, voice_id=None):
+        """Speaks chunks as an iterator produces them (e.g. stream_sentences over LLM deltas).
+
+        The Utterance's text grows with every chunk that was spoken.
+        """
+        return self._speak(Utterance(""), chunks, voice_id, streaming=True)
+
+    def _speak(self, utterance, chunks, voice_id=None, streaming=False):
+        voice_id = voice_id or self.voice_id
+        started = time.perf_counter()
+
+        def run():
+            # Clips are queued on the sink as soon as they are synthesized; it plays them back to back
+            pieces = iter(chunks)
+            while not utterance.stopped:
+                try:
+                    chunk = next(pieces, None)
+                except Exception as e:
+                    print(f"   ❌ Reply Stream Error: {e}")
+                    break
+                if chunk is None:
+                    break
+                if streaming:
+                    utterance.text = f"{utterance.text} {chunk}".strip()
+                try:
+                    audio = self.synth(chunk, voice_id)
+                except Exception as e:
+                    print(f"   ❌ TTS Error: {e}")
+                    continue
+                if utterance.stopped:
+                    break
+                clip = self.sink.play_async(audio)
+                clip.add_start_callback(lambda _: utterance._started())  # the reply is audible once its first clip is
+                utterance.clips.append(clip)
+            if hasattr(pieces, "close"):
+                pieces.close()  # stopped mid-reply: let go of the upstream stream
+
+            for clip in utterance.clips:
+                clip.wait()
+                if clip.error:
+                    print(f"   ❌ Audio Error: {clip.error}")
+                if clip.started_at and utterance.time_to_first_audio is None:
+                    utterance.time_to_first_audio = clip.started_at - started
+            self.last_time_to_first_audio = utterance.time_to_first_audio
+            utterance._finish()
+
+        threading.Thread(target=run, daemon=True).start()
+        return utterance
+
+    def speak(self, text, voice_id=None):
+        """Plays `text` and returns the time-to-first-audio in seconds (None if nothing played)"""
+        utterance = self.speak_async(text, voice_id)
+        utterance.wait()
+        return utterance.time_to_first_audio
@@ -0,0 +1,63 @@
+"""
+Pre-synthesizes lines an agent knows before the user speaks (intros, farewells, round announcements).
+
+Each agent lists them in a module-level STATIC_LINES (text, or (text, voice_id) for a non-default voice).
+
+At startup:
+    warm_up(speaker, STATIC_LINES)          # returns immediately, fills the cache in the background
+
+At build time, into the on-disk clip cache (.tts_cache / TTS_CACHE_DIR):
+    python -m voice_core.warmup day7_grocer day10_improv
+"""
+import sys
+import time
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _synthesize_all(speaker, lines, workers, persist):
+    started = time.perf_counter()
+    jobs = []
+    for line in lines:
+        # A line is either plain text or (text, voice_id) for agents with several voices
+        text, voice_id = (line, None) if isinstance(line, str) else line
+        jobs.append((text, voice_id))
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(speaker.prepare, text, voice_id, persist) for text, voice_id in jobs]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                print(f"   ❌ Warm-up Error: {e}")
+
+    elapsed = time.perf_counter() - started
+    return {"lines": len(jobs), "failed": failed, "seconds": elapsed}
+
+
+def warm_up(speaker, lines, workers=4, background=True, persist=True):
+    """Synthesizes `lines` in parallel. In the background by default; returns the thread or the stats.
+
+    persist=False keeps the clips out of the on-disk cache, for lines that carry user data.
+    """
+    lines = [line for line in lines if line]
+    if not background:
+        return _synthesize_all(speaker, lines, workers, persist)
+    thread = threading.Thread(target=_synthesize_all, args=(speaker, lines, workers, persist), daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m voice_core.warmup <agent_module> [<agent_module> ...]")
+        sys.exit(1)
+
+    for module_name in sys.argv[1:]:
+        agent = importlib.import_module(module_name)
+        lines = getattr(agent, "STATIC_LINES", [])
+        stats = warm_up(agent.speaker, lines, background=False)
+        print(f"🔥 {module_name}: {stats['lines']} lines warmed in {stats['seconds']:.1f}s ({stats['failed']} failed)")
@@ -0,0 +1,91 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class WellnessJournal:
+    """Daily check-ins per user in SQLite, indexed on (user, date).
+
+    The latest check-in and date ranges (last week's moods) are index
+    lookups that read only the rows they return, however long the user's
+    history grows; adding a check-in is a single-row insert. Agents that
+    kept a JSON log move it in with import_json() when the database is new.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS checkins (
+                    id INTEGER PRIMARY KEY,
+                    user TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    mood TEXT,
+                    energy_level TEXT,
+                    goals TEXT,
+                    summary TEXT
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS checkins_user_date ON checkins (user, date)")
+
+    @staticmethod
+    def _entry(row):
+        entry = dict(row)
+        entry["goals"] = json.loads(entry["goals"] or "[]")
+        return entry
+
+    def add(self, user, entry):
+        """Stores one check-in; `entry` has mood, energy_level, goals, summary and optionally date"""
+        return self.add_many(user, [entry])[0]
+
+    def add_many(self, user, entries):
+        """Stores several check-ins in one transaction; returns them with their dates"""
+        now = datetime.now().strftime(DATE_FORMAT)
+        entries = [{**entry, "date": entry.get("date") or now} for entry in entries]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO checkins (user, date, mood, energy_level, goals, summary) VALUES (?, ?, ?, ?, ?, ?)",
+                [(user, entry["date"], entry.get("mood"), entry.get("energy_level"),
+                  json.dumps(entry.get("goals") or []), entry.get("summary")) for entry in entries])
+        return entries
+
+    def latest(self, user):
+        """The user's most recent check-in, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM checkins WHERE user = ? ORDER BY date DESC, id DESC LIMIT 1", (user,)).fetchone()
+        return self._entry(row) if row else None
+
+    def between(self, user, start, end=None):
+        """The user's check-ins from `start` up to `end` (datetimes or date strings), oldest first"""
+        start = start.strftime(DATE_FORMAT) if isinstance(start, datetime) else start
+        end = end.strftime(DATE_FORMAT) if isinstance(end, datetime) else end
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM checkins WHERE user = ? AND date >= ? AND date <= ? ORDER BY date, id",
+                (user, start, end or "9999")).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def recent(self, user, days=7):
+        """Check-ins from the last `days` days, oldest first"""
+        return self.between(user, datetime.now() - timedelta(days=days))
+
+    def mood_trend(self, user, days=7):
+        """One line per check-in of the last `days` days, e.g. "Mon 03: Anxious (energy Low)", for the prompt"""
+        return [f"{datetime.strptime(entry['date'], DATE_FORMAT).strftime('%a %d')}: {entry['mood']} "
+                f"(energy {entry['energy_level']})" for entry in self.recent(user, days)]
+
+    def import_json(self, user, path):
+        """Adds the check-ins of a legacy JSON array file to `user`; returns how many"""
+        with open(path, "r") as f:
+            return len(self.add_many(user, json.load(f)))
+
+    def close(self):
+        self._conn.close()